@@ -5,6 +5,7 @@ import time
 from typing import Optional
 import aio_pika
 from aio_pika import Connection, Channel, Queue, Message, Exchange
+from utils.json_codec import dumps, loads
 from utils.shared_state import SharedState
 from utils.statistics import Statistics
 
@@ -78,9 +79,11 @@ class ControlListener:
         async with message.process():
             correlation_id = None
             command = None
+            # Клиенты с direct reply-to ждут ответ в своем канале, а не в response exchange
+            reply_to = message.reply_to
             
             try:
-                command_data = json.loads(message.body.decode())
+                command_data = loads(message.body)
                 correlation_id = command_data.get("correlation_id")
                 command = command_data.get("command")
                 
@@ -92,7 +95,8 @@ class ControlListener:
                         correlation_id,
                         None,
                         "Missing required field: command",
-                        "invalid_command"
+                        "invalid_command",
+                        reply_to
                     )
                     return
                 
@@ -100,7 +104,7 @@ class ControlListener:
                 response = await self._execute_command(command_data)
                 
                 # Отправка ответа
-                await self._send_response(response)
+                await self._send_response(response, reply_to)
                 
             except json.JSONDecodeError as e:
                 self.logger.error(f"Invalid JSON: {e}")
@@ -108,7 +112,8 @@ class ControlListener:
                     correlation_id,
                     command,
                     f"Invalid JSON: {str(e)}",
-                    "invalid_json"
+                    "invalid_json",
+                    reply_to
                 )
             except Exception as e:
                 self.logger.error(f"Error processing command: {e}")
@@ -116,7 +121,8 @@ class ControlListener:
                     correlation_id,
                     command,
                     f"Internal error: {str(e)}",
-                    "internal_error"
+                    "internal_error",
+                    reply_to
                 )
     
     async def _execute_command(self, command_data: dict) -> dict:
@@ -182,20 +188,54 @@ class ControlListener:
                 "timestamp": int(time.time())
             }
         
+        # add_symbols / remove_symbols
+        elif command in ("add_symbols", "remove_symbols"):
+            symbols = command_data.get("symbols")
+            if not symbols or not isinstance(symbols, list) or not all(isinstance(symbol, str) for symbol in symbols):
+                return {
+                    "correlation_id": correlation_id,
+                    "success": False,
+                    "command": command,
+                    "message": "Missing or invalid field: symbols (must be array of strings)",
+                    "error": "invalid_command",
+                    "timestamp": int(time.time())
+                }
+            
+            if command == "add_symbols":
+                changed = await self.shared_state.add_symbols(symbols)
+                action = "added"
+            else:
+                changed = await self.shared_state.remove_symbols(symbols)
+                action = "removed"
+            current_symbols = await self.shared_state.get_symbols()
+            
+            return {
+                "correlation_id": correlation_id,
+                "success": True,
+                "command": command,
+                "message": f"{len(changed)} of {len(symbols)} symbols {action}",
+                "error": None,
+                "data": {
+                    action: changed,
+                    "current_symbols": current_symbols
+                },
+                "timestamp": int(time.time())
+            }
+        
         # set_symbols
         elif command == "set_symbols":
             symbols = command_data.get("symbols")
-            if not symbols or not isinstance(symbols, list):
+            if not symbols or not isinstance(symbols, list) or not all(isinstance(symbol, str) for symbol in symbols):
                 return {
                     "correlation_id": correlation_id,
                     "success": False,
                     "command": command,
-                    "message": "Missing or invalid field: symbols (must be array)",
+                    "message": "Missing or invalid field: symbols (must be array of strings)",
                     "error": "invalid_command",
                     "timestamp": int(time.time())
                 }
             
-            await self.shared_state.set_symbols(symbols)
+            changes = await self.shared_state.set_symbols(symbols)
             current_symbols = await self.shared_state.get_symbols()
             
             return {
@@ -206,7 +246,9 @@ class ControlListener:
                 "error": None,
                 "data": {
                     "symbols": current_symbols,
-                    "count": len(current_symbols)
+                    "count": len(current_symbols),
+                    "added": changes["added"],
+                    "removed": changes["removed"]
                 },
                 "timestamp": int(time.time())
             }
@@ -256,27 +298,28 @@ class ControlListener:
                 "timestamp": int(time.time())
             }
     
-    async def _send_response(self, response: dict):
-        """Отправить ответ в response exchange"""
+    async def _send_response(self, response: dict, reply_to: Optional[str] = None):
+        """Отправить ответ в response exchange или в reply_to очередь клиента"""
         try:
-            routing_key = f"control.response.{response['command']}"
-            
-            await self.response_exchange.publish(
-                Message(
-                    body=json.dumps(response).encode('utf-8'),
-                    content_type='application/json',
-                    correlation_id=response.get('correlation_id')
-                ),
-                routing_key=routing_key
+            message = Message(
+                body=dumps(response),
+                content_type='application/json',
+                correlation_id=response.get('correlation_id')
             )
             
+            if reply_to:
+                await self.channel.default_exchange.publish(message, routing_key=reply_to)
+            else:
+                routing_key = f"control.response.{response['command']}"
+                await self.response_exchange.publish(message, routing_key=routing_key)
+            
             status = "✓" if response['success'] else "✗"
             self.logger.info(f"{status} Response sent: {response['command']} (id: {response['correlation_id']})")
             
         except Exception as e:
             self.logger.error(f"Failed to send response: {e}")
     
-    async def _send_error_response(self, correlation_id, command, message, error):
+    async def _send_error_response(self, correlation_id, command, message, error, reply_to: Optional[str] = None):
         """Отправить ответ об ошибке"""
         response = {
             "correlation_id": correlation_id,
@@ -286,7 +329,7 @@ class ControlListener:
             "error": error,
             "timestamp": int(time.time())
         }
-        await self._send_response(response)
+        await self._send_response(response, reply_to)
     
     async def close(self):
         """Закрыть соединение"""
@@ -1,3 +1,4 @@
+import aiohttp
 import ccxt.async_support as ccxt
 import time
 from typing import Optional
@@ -6,16 +7,21 @@ from models.futures_data import FuturesData, TickerData, OrderbookData
 
 
 class ExchangeCollector(BaseCollector):
-    def __init__(self, exchange_name: str, api_keys: dict, retry_attempts: int = 3, retry_delays: list = None):
+    def __init__(self, exchange_name: str, api_keys: dict, retry_attempts: int = 3, retry_delays: list = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         super().__init__(exchange_name, api_keys, retry_attempts, retry_delays)
         # Создаем экземпляр биржи через ccxt
         exchange_class = getattr(ccxt, exchange_name)
-        self.exchange = exchange_class({
+        exchange_config = {
             'apiKey': api_keys.get('apiKey'),
             'secret': api_keys.get('secret'),
             'options': {'defaultType': 'swap'},  # swap = perpetual futures
             'enableRateLimit': True
-        })
+        }
+        # Общая HTTP сессия: ccxt использует ее вместо своей и не закрывает в close()
+        if session is not None:
+            exchange_config['session'] = session
+        self.exchange = exchange_class(exchange_config)
         # Отключаем DEBUG логи от ccxt
         self.exchange.logger.setLevel('WARNING')
         # Кэш недоступных символов (чтобы не повторять запросы)
@@ -39,9 +39,9 @@ def apply_filter(data, filter):
         result = (data_value < filter_value)
 
     if result:
-        logger.debug(f"Filter {filter_type} requirements {data_value} >= {filter_value} are satisfied ")
+        logger.debug("Filter %s requirements %s >= %s are satisfied ", filter_type, data_value, filter_value)
     else:
-        logger.debug(f"Filter {filter_type} requirements {data_value} >= {filter_value} are NOT satisfied ")
+        logger.debug("Filter %s requirements %s >= %s are NOT satisfied ", filter_type, data_value, filter_value)
 
     return result
 
@@ -96,7 +96,7 @@ async def main():
         # если долго не было входящих данных, перестаем отправлять выходные данные
         last_update_time = await dr.get_last_update_time()
         delta_time = datetime.datetime.now() - last_update_time
-        logger.debug(f"Delta time {delta_time}")
+        logger.debug("Delta time %s", delta_time)
         #if delta_time > datetime.timedelta(seconds=at.settings["max_incoming_queue_delay"]):
         #    logger.info(f"Delta time is too big, disable sending data to output exchange")
         #    await dd.set_data(None)
@@ -4,9 +4,10 @@
 """
 
 import asyncio
+import heapq
 import time
 import weakref
-from typing import Any, Dict, Optional, Set, Tuple, Callable
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Callable, Container
 from dataclasses import dataclass, field
 from threading import RLock
 import logging
@@ -14,7 +15,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Запись в кэше с метаданными."""
     value: Any
@@ -22,6 +23,7 @@ class CacheEntry:
     ttl: float
     access_count: int = 0
     last_access: float = field(default_factory=time.time)
+    slot: int = -1  # Позиция в кольце CLOCK
     
     @property
     def is_expired(self) -> bool:
@@ -53,8 +55,17 @@ class CacheStats:
 class TTLCache:
     """
     Thread-safe TTL кэш с автоматической очисткой устаревших записей.
+    
+    При переполнении вытеснение идет по алгоритму CLOCK: ключи лежат в кольце
+    с битом обращения, стрелка сбрасывает биты и вытесняет первую запись,
+    к которой не обращались с прошлого прохода. Обращение к записи — запись
+    одного байта, без перестройки структур.
     """
     
+    __slots__ = ('max_size', 'default_ttl', 'cleanup_interval',
+                 '_cache', '_expiry', '_lock', '_stats', '_cleanup_task', '_running',
+                 '_clock_keys', '_clock_ref', '_clock_hand', '_free_slots')
+    
     def __init__(self, 
                  max_size: int = 1000,
                  default_ttl: float = 300.0,
@@ -67,11 +78,18 @@ class TTLCache:
             default_ttl: TTL по умолчанию в секундах
             cleanup_interval: Интервал очистки в секундах
         """
+        if max_size <= 0:
+            # Кольцу CLOCK нужна хотя бы одна позиция
+            raise ValueError(f"max_size must be positive, got {max_size}")
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.cleanup_interval = cleanup_interval
         
         self._cache: Dict[str, CacheEntry] = {}
+        # Куча (expires_at, key) для фоновой очистки; записи для удаленных
+        # или перезаписанных ключей отбрасываются при извлечении
+        self._expiry: List[Tuple[float, str]] = []
+        self._reset_clock()
         self._lock = RLock()
         self._stats = CacheStats()
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -100,20 +118,25 @@ class TTLCache:
     def get(self, key: str) -> Optional[Any]:
         """Получение значения из кэша."""
         with self._lock:
-            entry = self._cache.get(key)
-            
-            if entry is None:
-                self._stats.misses += 1
-                return None
-            
-            if entry.is_expired:
-                del self._cache[key]
-                self._stats.misses += 1
-                self._stats.evictions += 1
-                return None
-            
-            self._stats.hits += 1
-            return entry.access()
+            return self._get_unlocked(key)
+    
+    def _get_unlocked(self, key: str) -> Optional[Any]:
+        """Получение значения без захвата блокировки (вызывающий держит self._lock)."""
+        entry = self._cache.get(key)
+        
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        
+        if entry.is_expired:
+            self._remove(key)
+            self._stats.misses += 1
+            self._stats.evictions += 1
+            return None
+        
+        self._stats.hits += 1
+        self._clock_ref[entry.slot] = 1
+        return entry.access()
     
     def set(self, key: str, value: Any, ttl: Optional[float] = None):
         """Сохранение значения в кэш."""
@@ -123,7 +146,7 @@ class TTLCache:
         with self._lock:
             # Проверяем размер кэша и очищаем если нужно
             if len(self._cache) >= self.max_size and key not in self._cache:
-                self._evict_oldest()
+                self._evict(1)
             
             entry = CacheEntry(
                 value=value,
@@ -131,14 +154,44 @@ class TTLCache:
                 ttl=ttl
             )
             
-            self._cache[key] = entry
+            self._store(key, entry)
+            self._schedule_expiry(entry.created_at + ttl, key)
+            self._stats.size = len(self._cache)
+    
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Получение нескольких значений за один захват блокировки (None для промахов)."""
+        with self._lock:
+            return [self._get_unlocked(key) for key in keys]
+    
+    def set_many(self, items: Mapping[str, Any], ttl: Optional[float] = None):
+        """Сохранение нескольких значений за один захват блокировки."""
+        if ttl is None:
+            ttl = self.default_ttl
+        
+        if len(items) > self.max_size:
+            # В кэш поместятся только последние max_size записей
+            items = dict(list(items.items())[-self.max_size:])
+        
+        now = time.time()
+        with self._lock:
+            new_keys = sum(1 for key in items if key not in self._cache)
+            overflow = len(self._cache) + new_keys - self.max_size
+            if overflow > 0:
+                # Перезаписываемые ключи не вытесняем, иначе места не хватит
+                self._evict(overflow, keep=items)
+            
+            for key, value in items.items():
+                self._store(key, CacheEntry(value=value, created_at=now, ttl=ttl))
+            expires_at = now + ttl
+            for key in items:
+                self._schedule_expiry(expires_at, key)
             self._stats.size = len(self._cache)
     
     def delete(self, key: str) -> bool:
         """Удаление значения из кэша."""
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 self._stats.size = len(self._cache)
                 return True
             return False
@@ -147,6 +200,8 @@ class TTLCache:
         """Очистка всего кэша."""
         with self._lock:
             self._cache.clear()
+            self._expiry.clear()
+            self._reset_clock()
             self._stats.size = 0
             self._stats.evictions += len(self._cache)
     
@@ -161,15 +216,50 @@ class TTLCache:
                 size=self._stats.size
             )
     
-    def _evict_oldest(self):
-        """Удаление самой старой записи."""
-        if not self._cache:
-            return
+    def _reset_clock(self):
+        """Пустое кольцо CLOCK на max_size позиций."""
+        self._clock_keys: List[Optional[str]] = [None] * self.max_size
+        self._clock_ref = bytearray(self.max_size)
+        self._clock_hand = 0
+        self._free_slots: List[int] = list(range(self.max_size - 1, -1, -1))
+    
+    def _store(self, key: str, entry: CacheEntry):
+        """Запись в кэш с привязкой к позиции кольца (вызывающий держит self._lock)."""
+        previous = self._cache.get(key)
+        if previous is not None:
+            entry.slot = previous.slot
+        else:
+            entry.slot = self._free_slots.pop()
+            self._clock_keys[entry.slot] = key
+            self._clock_ref[entry.slot] = 0
+        self._cache[key] = entry
+    
+    def _remove(self, key: str):
+        """Удаление записи и освобождение ее позиции (вызывающий держит self._lock)."""
+        slot = self._cache.pop(key).slot
+        self._clock_keys[slot] = None
+        self._clock_ref[slot] = 0
+        self._free_slots.append(slot)
+    
+    def _evict(self, count: int, keep: Container[str] = ()):
+        """Вытеснение count записей по алгоритму CLOCK (ключи из keep пропускаются)."""
+        evicted = 0
+        while evicted < count and self._cache:
+            hand = self._clock_hand
+            self._clock_hand = (hand + 1) % self.max_size
             
-        oldest_key = min(self._cache.keys(), 
-                        key=lambda k: self._cache[k].last_access)
-        del self._cache[oldest_key]
-        self._stats.evictions += 1
+            key = self._clock_keys[hand]
+            if key is None or key in keep:
+                continue
+            if self._clock_ref[hand]:
+                # Второй шанс: к записи обращались с прошлого прохода
+                self._clock_ref[hand] = 0
+                continue
+            
+            self._remove(key)
+            evicted += 1
+        
+        self._stats.evictions += evicted
     
     async def _cleanup_loop(self):
         """Фоновая очистка устаревших записей."""
@@ -182,17 +272,31 @@ class TTLCache:
             except Exception as e:
                 logger.error(f"Error in cache cleanup: {e}")
     
+    def _schedule_expiry(self, expires_at: float, key: str):
+        """Постановка ключа в кучу истечения (вызывающий держит self._lock)."""
+        heapq.heappush(self._expiry, (expires_at, key))
+        
+        # Перезаписи копят устаревшие элементы кучи: пересобираем по живым записям
+        if len(self._expiry) > 4 * max(self.max_size, len(self._cache)):
+            self._expiry = [
+                (entry.created_at + entry.ttl, cached_key)
+                for cached_key, entry in self._cache.items()
+            ]
+            heapq.heapify(self._expiry)
+    
     def _cleanup_expired(self):
-        """Очистка устаревших записей."""
+        """Очистка устаревших записей: разбор только наступивших сроков из кучи."""
+        now = time.time()
         with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired
-            ]
+            expired_keys = []
+            while self._expiry and self._expiry[0][0] <= now:
+                _, key = heapq.heappop(self._expiry)
+                entry = self._cache.get(key)
+                if entry is not None and entry.created_at + entry.ttl <= now:
+                    self._remove(key)
+                    expired_keys.append(key)
             
-            for key in expired_keys:
-                del self._cache[key]
-                self._stats.evictions += 1
+            self._stats.evictions += len(expired_keys)
             
             if expired_keys:
                 logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -204,6 +308,8 @@ class CacheManager:
     Менеджер множественных кэшей для разных типов данных.
     """
     
+    __slots__ = ('_caches', '_running')
+    
     def __init__(self):
         self._caches: Dict[str, TTLCache] = {}
         self._running = False
@@ -265,16 +371,30 @@ class CacheManager:
     def get(self, cache_type: str, key: str) -> Optional[Any]:
         """Получение значения из указанного кэша."""
         cache = self._caches.get(cache_type)
-        if cache:
+        if cache is not None:
             return cache.get(key)
         return None
     
     def set(self, cache_type: str, key: str, value: Any, ttl: Optional[float] = None):
         """Установка значения в указанный кэш."""
         cache = self._caches.get(cache_type)
-        if cache:
+        if cache is not None:
             cache.set(key, value, ttl)
     
+    def get_many(self, cache_type: str, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Получение нескольких значений из указанного кэша."""
+        keys = list(keys)
+        cache = self._caches.get(cache_type)
+        if cache is not None:
+            return cache.get_many(keys)
+        return [None] * len(keys)
+    
+    def set_many(self, cache_type: str, items: Mapping[str, Any], ttl: Optional[float] = None):
+        """Установка нескольких значений в указанный кэш."""
+        cache = self._caches.get(cache_type)
+        if cache is not None:
+            cache.set_many(items, ttl)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Получение общей статистики кэшей."""
         all_stats = self.get_all_stats()
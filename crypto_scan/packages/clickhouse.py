@@ -24,16 +24,19 @@ TIMESTAMP_FIELD = "timestamp"
 
 
 class ClickhouseConnector:
-    def __init__(self, connection_string, database_name, table_name=None, json_as_string=False):
+    def __init__(self, connection_string, database_name, table_name=None, json_as_string=False, pool_mgr=None):
         self.connection_string = connection_string
         self.database_name = database_name
         self.table_name = table_name
         self.json_as_string = json_as_string
+        # пул HTTP соединений urllib3; None - общий пул clickhouse_connect по умолчанию
+        self.pool_mgr = pool_mgr
         self.client = self._get_client()
 
     def _get_client(self):
         try:
-            return clickhouse_connect.get_client(dsn=self.connection_string, database=self.database_name)
+            return clickhouse_connect.get_client(dsn=self.connection_string, database=self.database_name,
+                                                 pool_mgr=self.pool_mgr)
         except Exception as e:
             logging.error(f"Error connecting to Clickhouse: {e}")
             return None
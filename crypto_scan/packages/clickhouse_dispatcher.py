@@ -44,7 +44,7 @@ def setup_logger(logger_name, level=logging.INFO):
 
 
 class ClickhouseDispatcher(DataDispatcher):
-    def __init__(self, delay = 5, connection_string = ""):
+    def __init__(self, delay = 5, connection_string = "", pool_mgr=None):
         # super().__init__(user, password, host, exchange, delay)
         self.data_lock = asyncio.Lock()
         self.data = []
@@ -52,7 +52,8 @@ class ClickhouseDispatcher(DataDispatcher):
         self.connection_string = connection_string
         self.clickhouse_connector = ClickhouseConnector(connection_string=self.connection_string,
                                                         database_name=DATABASE_NAME,
-                                                        table_name=TABLE_NAME)
+                                                        table_name=TABLE_NAME,
+                                                        pool_mgr=pool_mgr)
         if self.clickhouse_connector:
             logger.info("Connection to Clickhouse is established")
         else:
@@ -161,6 +161,39 @@ class AdaptiveRateLimiter:
         )
 
 
+def _create_session(max_connections: int) -> Tuple[aiohttp.TCPConnector, aiohttp.ClientSession]:
+    """Keep-alive сессия с connector на max_connections соединений."""
+    # Создаем оптимизированный connector
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=max_connections,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        keepalive_timeout=30,
+        enable_cleanup_closed=True
+    )
+    
+    # Создаем сессию с оптимизированными настройками
+    timeout = aiohttp.ClientTimeout(
+        total=30,
+        connect=10,
+        sock_read=20
+    )
+    
+    session = aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={
+            'User-Agent': 'CryptoCollector/2.0',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        }
+    )
+    
+    return connector, session
+
+
 class ConnectionPool:
     """
     Пул соединений для конкретной биржи.
@@ -169,12 +202,15 @@ class ConnectionPool:
     def __init__(self, 
                  exchange_name: str,
                  max_connections: int = 10,
-                 rate_limit_config: Optional[RateLimitConfig] = None):
+                 rate_limit_config: Optional[RateLimitConfig] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.exchange_name = exchange_name
         self.max_connections = max_connections
         self.rate_limiter = AdaptiveRateLimiter(rate_limit_config or RateLimitConfig())
         
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Переданную сессию (общую сессию менеджера) пул не создает и не закрывает
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self._semaphore = asyncio.Semaphore(max_connections)
         self._stats = ConnectionStats()
         self._connector: Optional[aiohttp.TCPConnector] = None
@@ -182,40 +218,22 @@ class ConnectionPool:
     async def start(self):
         """Инициализация пула соединений."""
         if self._session:
+            logger.info(f"Connection pool started for {self.exchange_name} on shared session "
+                        f"with {self.max_connections} max concurrent requests")
             return
         
-        # Создаем оптимизированный connector
-        self._connector = aiohttp.TCPConnector(
-            limit=self.max_connections,
-            limit_per_host=self.max_connections,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-            keepalive_timeout=30,
-            enable_cleanup_closed=True
-        )
-        
-        # Создаем сессию с оптимизированными настройками
-        timeout = aiohttp.ClientTimeout(
-            total=30,
-            connect=10,
-            sock_read=20
-        )
-        
-        self._session = aiohttp.ClientSession(
-            connector=self._connector,
-            timeout=timeout,
-            headers={
-                'User-Agent': 'CryptoCollector/2.0',
-                'Accept': 'application/json',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive'
-            }
-        )
+        self._connector, self._session = _create_session(self.max_connections)
         
         logger.info(f"Connection pool started for {self.exchange_name} with {self.max_connections} max connections")
     
     async def stop(self):
         """Закрытие пула соединений."""
+        if not self._owns_session:
+            # Общая сессия закрывается ее владельцем
+            self._session = None
+            logger.info(f"Connection pool stopped for {self.exchange_name}")
+            return
+        
         if self._session:
             await self._session.close()
             self._session = None
@@ -301,12 +319,20 @@ class ConnectionPool:
 class ConnectionPoolManager:
     """
     Менеджер пулов соединений для всех бирж.
+    
+    Держит одну keep-alive сессию, общую для всех бирж, чтобы запросы
+    переиспользовали открытые TCP/TLS соединения вместо новых рукопожатий.
     """
     
-    def __init__(self):
+    def __init__(self, max_connections: int = 100):
+        self.max_connections = max_connections
         self._pools: Dict[str, ConnectionPool] = {}
         self._running = False
         
+        # Общая сессия создается в start(), когда уже есть event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        
         # Конфигурации rate limiting для разных бирж
         self._rate_configs = {
             'binance': RateLimitConfig(requests_per_second=20.0, burst_size=50),
@@ -321,8 +347,9 @@ class ConnectionPoolManager:
         if self._running:
             return
         
+        self._connector, self._session = _create_session(self.max_connections)
         self._running = True
-        logger.info("Connection Pool Manager started")
+        logger.info(f"Connection Pool Manager started with {self.max_connections} shared connections")
     
     async def stop(self):
         """Остановка всех пулов."""
@@ -336,8 +363,23 @@ class ConnectionPoolManager:
             await pool.stop()
         
         self._pools.clear()
+        
+        if self._session:
+            await self._session.close()
+            self._session = None
+        
+        if self._connector:
+            await self._connector.close()
+            self._connector = None
+        
         logger.info("Connection Pool Manager stopped")
     
+    def get_session(self) -> aiohttp.ClientSession:
+        """Общая keep-alive сессия для всех бирж."""
+        if not self._session:
+            raise RuntimeError("Connection Pool Manager not started")
+        return self._session
+    
     async def get_pool(self, exchange_name: str, max_connections: int = 10) -> ConnectionPool:
         """Получение или создание пула для биржи."""
         if exchange_name not in self._pools:
@@ -346,10 +388,13 @@ class ConnectionPoolManager:
                 self._rate_configs['default']
             )
             
+            # Пул биржи ограничивает параллельность и частоту запросов,
+            # а соединения берет из общей сессии менеджера
             pool = ConnectionPool(
                 exchange_name=exchange_name,
                 max_connections=max_connections,
-                rate_limit_config=rate_config
+                rate_limit_config=rate_config,
+                session=self.get_session()
             )
             
             await pool.start()
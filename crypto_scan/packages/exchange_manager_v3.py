@@ -9,9 +9,11 @@ import time
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
 
+import aiohttp
 import ccxt.async_support as ccxt_async
 import ccxt
 
+from connection_pool import ConnectionPoolManager
 from circuit_breaker import CircuitBreakerManager, CircuitBreakerConfig, CircuitBreakerError
 from retry_manager import RetryManagerRegistry, RetryConfig, RetryStrategy
 from health_monitor import HealthMonitor, HealthCheckConfig, HealthStatus
@@ -52,7 +54,8 @@ class ResilientExchange:
         config: ExchangeConfig,
         circuit_breaker_manager: CircuitBreakerManager,
         retry_registry: RetryManagerRegistry,
-        health_monitor: HealthMonitor
+        health_monitor: HealthMonitor,
+        session: Optional[aiohttp.ClientSession] = None
     ):
         self.config = config
         self.name = config.name
@@ -62,6 +65,9 @@ class ResilientExchange:
         self.retry_registry = retry_registry
         self.health_monitor = health_monitor
         
+        # Общая HTTP сессия (None - CCXT создаст свою)
+        self.session = session
+        
         # CCXT exchanges
         self.async_exchange: Optional[ccxt_async.Exchange] = None
         self.sync_exchange: Optional[ccxt.Exchange] = None
@@ -170,6 +176,10 @@ class ResilientExchange:
             if self.config.rate_limit:
                 exchange_params['rateLimit'] = self.config.rate_limit
             
+            # Чужую сессию CCXT не закрывает в close()
+            if self.session is not None:
+                exchange_params['session'] = self.session
+            
             self.async_exchange = exchange_class(exchange_params)
             
             # Создаем sync exchange для некоторых операций
@@ -337,6 +347,7 @@ class ResilientExchangeManager:
         self.circuit_breaker_manager = CircuitBreakerManager()
         self.retry_registry = RetryManagerRegistry()
         self.health_monitor = HealthMonitor()
+        self.connection_pool_manager = ConnectionPoolManager()
         
         # Статистика
         self.stats = {
@@ -357,8 +368,10 @@ class ResilientExchangeManager:
         
         logger.info(f"Initializing {len(configs)} exchanges with resilience components...")
         
-        # Запускаем health monitor
+        # Запускаем health monitor и общий пул соединений
         await self.health_monitor.start()
+        await self.connection_pool_manager.start()
+        session = self.connection_pool_manager.get_session()
         
         # Инициализируем биржи параллельно
         init_tasks = []
@@ -368,7 +381,8 @@ class ResilientExchangeManager:
                     config,
                     self.circuit_breaker_manager,
                     self.retry_registry,
-                    self.health_monitor
+                    self.health_monitor,
+                    session=session
                 )
                 self.exchanges[config.name] = exchange
                 init_tasks.append(self._initialize_single_exchange(exchange))
@@ -535,6 +549,9 @@ class ResilientExchangeManager:
         if close_tasks:
             await asyncio.gather(*close_tasks, return_exceptions=True)
         
+        # Общую сессию закрываем после бирж, которые ее используют
+        await self.connection_pool_manager.stop()
+        
         logger.info("All exchanges closed")
     
     def get_status(self) -> Dict[str, Any]:
@@ -11,6 +11,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
 
+from outcome_window import OutcomeWindow
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,9 +52,13 @@ class HealthMetrics:
     last_failure_time: Optional[float] = None
     
     # История для анализа трендов
-    recent_checks: deque = field(default_factory=lambda: deque(maxlen=100))
+    recent_checks: OutcomeWindow = field(default_factory=OutcomeWindow)
     response_times: deque = field(default_factory=lambda: deque(maxlen=50))
     
+    def record_check(self, success: bool):
+        """Добавление исхода в недавнюю историю."""
+        self.recent_checks.record(success)
+    
     @property
     def success_rate(self) -> float:
         """Процент успешных проверок."""
@@ -63,11 +69,7 @@ class HealthMetrics:
     @property
     def recent_success_rate(self) -> float:
         """Процент успешных проверок в недавней истории."""
-        if not self.recent_checks:
-            return 0.0
-        
-        successful = sum(1 for success in self.recent_checks if success)
-        return (successful / len(self.recent_checks)) * 100
+        return self.recent_checks.success_rate
     
     @property
     def average_response_time(self) -> float:
@@ -188,7 +190,7 @@ class HealthCheck:
         self.metrics.consecutive_successes += 1
         self.metrics.consecutive_failures = 0
         self.metrics.last_success_time = time.time()
-        self.metrics.recent_checks.append(True)
+        self.metrics.record_check(True)
         
         # Определяем новый статус
         old_status = self.status
@@ -221,7 +223,7 @@ class HealthCheck:
         self.metrics.consecutive_failures += 1
         self.metrics.consecutive_successes = 0
         self.metrics.last_failure_time = time.time()
-        self.metrics.recent_checks.append(False)
+        self.metrics.record_check(False)
         
         # Определяем новый статус
         old_status = self.status
@@ -0,0 +1,35 @@
+"""
+Скользящее окно исходов (успех/неудача) с поддерживаемым счетчиком успехов.
+Общая основа для статистики retry механизмов и health checks.
+"""
+
+from collections import deque
+
+
+class OutcomeWindow:
+    """Последние N исходов и число успехов среди них без пересчета окна."""
+    
+    __slots__ = ("outcomes", "successes")
+    
+    def __init__(self, maxlen: int = 100):
+        self.outcomes: deque = deque(maxlen=maxlen)
+        self.successes = 0
+    
+    def record(self, success: bool):
+        """Добавление исхода в окно с обновлением счетчика успехов."""
+        outcomes = self.outcomes
+        if len(outcomes) == outcomes.maxlen and outcomes[0]:
+            self.successes -= 1
+        outcomes.append(success)
+        if success:
+            self.successes += 1
+    
+    @property
+    def success_rate(self) -> float:
+        """Процент успешных исходов в окне."""
+        if not self.outcomes:
+            return 0.0
+        return (self.successes / len(self.outcomes)) * 100
+    
+    def __len__(self) -> int:
+        return len(self.outcomes)
@@ -47,9 +47,13 @@ class DataReceiver:
         self.received_data = []
         self.last_update_time_lock = asyncio.Lock()
         self.last_update_time = datetime.datetime.min  # Исправлено начальное значение
+        # время последнего обновления по монотонным часам event loop, None - данных еще не было
+        self.last_update_monotonic = None
         self.delay = delay
         self.rabbitmq_client = None
         self.updated = False
+        # выставляется при получении новых данных, чтобы потребители не ждали полный интервал
+        self.data_updated = asyncio.Event()
         loop = asyncio.get_event_loop()
         loop.create_task(self.main_loop(user, password, host, exchange))
 
@@ -61,10 +65,25 @@ class DataReceiver:
         async with self.received_data_lock:
             self.received_data = copy.deepcopy(value)
 
+    async def wait_for_update(self, timeout):
+        """Ждет новых данных не дольше timeout секунд. Возвращает True, если данные пришли"""
+        try:
+            await asyncio.wait_for(self.data_updated.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self.data_updated.clear()
+        return True
+
     async def get_last_update_time(self):
         async with self.last_update_time_lock:
             return copy.deepcopy(self.last_update_time)
 
+    def seconds_since_update(self):
+        """Сколько секунд прошло с получения последних данных (inf, если данных еще не было)"""
+        if self.last_update_monotonic is None:
+            return float('inf')
+        return asyncio.get_running_loop().time() - self.last_update_monotonic
+
     async def set_last_update_time(self, value):
         async with self.last_update_time_lock:
             self.last_update_time = copy.deepcopy(value)
@@ -100,6 +119,8 @@ class DataReceiver:
                 logger.debug(f"Latest received data length: {data_length}")
                 await self.set_data(new_data)
                 await self.set_last_update_time(datetime.datetime.now())
+                self.last_update_monotonic = asyncio.get_running_loop().time()
+                self.data_updated.set()
             else:
                 logger.debug("No new data received")
         except Exception as e:
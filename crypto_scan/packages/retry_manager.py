@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
 
+from outcome_window import OutcomeWindow
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,9 +64,13 @@ class RetryStats:
     max_retries_reached: int = 0
     
     # История для адаптации
-    recent_attempts: deque = field(default_factory=lambda: deque(maxlen=100))
+    recent_attempts: OutcomeWindow = field(default_factory=OutcomeWindow)
     recent_delays: deque = field(default_factory=lambda: deque(maxlen=100))
     
+    def record_attempt(self, success: bool):
+        """Добавление исхода в недавнее окно."""
+        self.recent_attempts.record(success)
+    
     @property
     def success_rate(self) -> float:
         """Процент успешных попыток."""
@@ -82,11 +88,7 @@ class RetryStats:
     @property
     def recent_success_rate(self) -> float:
         """Процент успешных попыток в недавнем окне."""
-        if not self.recent_attempts:
-            return 0.0
-        
-        successful = sum(1 for success in self.recent_attempts if success)
-        return (successful / len(self.recent_attempts)) * 100
+        return self.recent_attempts.success_rate
 
 
 class RetryManager:
@@ -128,7 +130,7 @@ class RetryManager:
                 
                 # Успешное выполнение
                 self.stats.successful_attempts += 1
-                self.stats.recent_attempts.append(True)
+                self.stats.record_attempt(True)
                 
                 if attempt > 1:
                     self.stats.total_retries += (attempt - 1)
@@ -165,7 +167,7 @@ class RetryManager:
         
         # Все попытки исчерпаны
         self.stats.failed_attempts += 1
-        self.stats.recent_attempts.append(False)
+        self.stats.record_attempt(False)
         
         # Адаптация параметров при неудаче
         await self._adapt_on_failure(attempt, time.time() - start_time)
@@ -10,6 +10,10 @@ import subprocess
 import argparse
 import time
 from pathlib import Path
+from typing import Optional
+
+# Overrides the "-m 'not slow'" default from pytest.ini so slow tests run too
+INCLUDE_SLOW = "slow or not slow"
 
 
 def run_command(cmd: list, description: str = "") -> tuple[int, str, str]:
@@ -48,7 +52,14 @@ def run_command(cmd: list, description: str = "") -> tuple[int, str, str]:
         return 1, "", str(e)
 
 
-def run_unit_tests():
+def xdist_args(workers: Optional[str]) -> list:
+    """pytest-xdist options; each test class stays on one worker with --dist=loadscope."""
+    if not workers:
+        return []
+    return ["-n", workers, "--dist=loadscope"]
+
+
+def run_unit_tests(workers: Optional[str] = None):
     """Run unit tests."""
     cmd = [
         sys.executable, "-m", "pytest", 
@@ -56,7 +67,7 @@ def run_unit_tests():
         "tests/test_exchange_manager.py", 
         "tests/test_resilience_components.py",
         "-v", "--tb=short", "-x"
-    ]
+    ] + xdist_args(workers)
     return run_command(cmd, "Running Unit Tests")
 
 
@@ -75,32 +86,35 @@ def run_performance_tests():
     cmd = [
         sys.executable, "-m", "pytest",
         "tests/test_performance.py",
+        "tests/test_resilience_components.py::TestResiliencePerformance",
+        "-m", INCLUDE_SLOW,
         "-v", "--tb=short", "-s"
     ]
     return run_command(cmd, "Running Performance Tests")
 
 
-def run_all_tests():
+def run_all_tests(workers: Optional[str] = None):
     """Run all tests with coverage."""
     cmd = [
         sys.executable, "-m", "pytest",
         "tests/",
+        "-m", INCLUDE_SLOW,
         "-v", "--tb=short",
         "--cov=packages",
         "--cov-report=html:htmlcov",
         "--cov-report=term-missing",
         "--cov-fail-under=70"
-    ]
+    ] + xdist_args(workers)
     return run_command(cmd, "Running All Tests with Coverage")
 
 
-def run_specific_test(test_path: str):
+def run_specific_test(test_path: str, workers: Optional[str] = None):
     """Run a specific test file or test function."""
     cmd = [
         sys.executable, "-m", "pytest",
         test_path,
         "-v", "--tb=short", "-s"
-    ]
+    ] + xdist_args(workers)
     return run_command(cmd, f"Running Specific Test: {test_path}")
 
 
@@ -112,6 +126,7 @@ def check_test_dependencies():
         'pytest',
         'pytest-asyncio', 
         'pytest-cov',
+        'pytest-benchmark',
         'psutil'
     ]
     
@@ -125,6 +140,21 @@ def check_test_dependencies():
             missing_packages.append(package)
             print(f"❌ {package}")
     
+    # Optional speed-ups (uvloop event loop, orjson mock serialization,
+    # xdist sharding for --workers): used when installed, never required
+    optional_packages = {
+        'uvloop': 'uvloop',
+        'orjson': 'orjson',
+        'pytest-xdist': 'xdist'
+    }
+    
+    for package, module in optional_packages.items():
+        try:
+            __import__(module)
+            print(f"✅ {package} (optional)")
+        except ImportError:
+            print(f"⚪ {package} (optional, not installed)")
+    
     if missing_packages:
         print(f"\n⚠️  Missing packages: {', '.join(missing_packages)}")
         print("Install with: pip install " + " ".join(missing_packages))
@@ -163,6 +193,7 @@ def main():
     parser.add_argument("--test", type=str, help="Run specific test file or function")
     parser.add_argument("--check-deps", action="store_true", help="Check test dependencies")
     parser.add_argument("--report", action="store_true", help="Generate test report")
+    parser.add_argument("--workers", type=str, help="Run tests on N pytest-xdist workers ('auto' = one per CPU)")
     
     args = parser.parse_args()
     
@@ -173,6 +204,13 @@ def main():
     if not check_test_dependencies():
         return 1
     
+    if args.workers:
+        try:
+            __import__('xdist')
+        except ImportError:
+            print("❌ --workers requires pytest-xdist. Install with: pip install pytest-xdist")
+            return 1
+    
     exit_code = 0
     
     try:
@@ -180,7 +218,7 @@ def main():
             return 0
         
         elif args.unit:
-            exit_code, _, _ = run_unit_tests()
+            exit_code, _, _ = run_unit_tests(args.workers)
             
         elif args.integration:
             exit_code, _, _ = run_integration_tests()
@@ -189,10 +227,10 @@ def main():
             exit_code, _, _ = run_performance_tests()
             
         elif args.test:
-            exit_code, _, _ = run_specific_test(args.test)
+            exit_code, _, _ = run_specific_test(args.test, args.workers)
             
         elif args.all:
-            exit_code, _, _ = run_all_tests()
+            exit_code, _, _ = run_all_tests(args.workers)
             
         elif args.report:
             generate_test_report()
@@ -202,7 +240,7 @@ def main():
             print("🚀 Running comprehensive test suite...")
             
             # Run unit tests first
-            unit_exit, _, _ = run_unit_tests()
+            unit_exit, _, _ = run_unit_tests(args.workers)
             if unit_exit != 0:
                 print("❌ Unit tests failed!")
                 exit_code = unit_exit
@@ -7,7 +7,7 @@ from packages.app_template import AppTemplate, logger
 from packages.json_utils import load_data_from_json
 from jsonpath_ng import parse
 from json_to_clickhouse import ClickHouseJSONHandler , make_connection_string
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 DEBUG = False
 
@@ -40,14 +40,31 @@ def setup_logging():
 # Инициализируем логирование при импорте модуля
 module_logger = setup_logging()
 
+# Возможные пути к данным (в порядке приоритета)
+_POSSIBLE_PATHS = (
+    ('data', 'items', 0, 'data'),  # Оригинальный путь
+    ('data', 'items', 0),          # Без последнего 'data'
+    ('data', 'items'),             # Массив items целиком
+    ('data',),                     # Только data
+    (),                            # Корневой уровень
+)
 
-def safe_get_nested_data(data: Dict[str, Any], path: List[str], default: Any = None) -> Any:
+# Пути к типу данных (в порядке приоритета)
+_DATA_TYPE_PATHS = (
+    ('data', 'type'),  # Оригинальный путь
+)
+
+# Поле с сырым ответом биржи, которое не сохраняется в ClickHouse
+_INFO_KEY = 'info'
+
+
+def safe_get_nested_data(data: Dict[str, Any], path: Sequence[Any], default: Any = None) -> Any:
     """
     Безопасно извлекает вложенные данные из словаря по указанному пути.
     
     Args:
         data: Исходный словарь с данными
-        path: Список ключей для навигации по вложенной структуре
+        path: Последовательность ключей для навигации по вложенной структуре
         default: Значение по умолчанию, если путь не найден
     
     Returns:
@@ -90,16 +107,7 @@ def extract_json_data_safely(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     Returns:
         Извлеченные данные или None, если данные не найдены
     """
-    # Возможные пути к данным (в порядке приоритета)
-    possible_paths = [
-        ['data', 'items', 0, 'data'],  # Оригинальный путь
-        ['data', 'items', 0],          # Без последнего 'data'
-        ['data', 'items'],             # Массив items целиком
-        ['data'],                      # Только data
-        [],                            # Корневой уровень
-    ]
-    
-    for path in possible_paths:
+    for path in _POSSIBLE_PATHS:
         result = safe_get_nested_data(data, path)
         if result is not None:
             module_logger.info(f"Данные найдены по пути: {path}")
@@ -120,11 +128,7 @@ def extract_json_data_type(data: Dict[str, Any]) -> Optional[str]:
     Returns:
         Извлеченные данные или None, если данные не найдены
     """
-    # Возможные пути к данным (в порядке приоритета)
-    possible_paths = [
-        ['data', 'type'],  # Оригинальный путь
-    ]
-    for path in possible_paths:
+    for path in _DATA_TYPE_PATHS:
         result = safe_get_nested_data(data, path)
         if result is not None:
             module_logger.info(f"Данные найдены по пути: {path}")
@@ -155,21 +159,24 @@ def transform_futures_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
         if not isinstance(exchange_value, dict):
             module_logger.warning(f"Пропускаем биржу {exchange_name}: данные не являются словарем")
             continue
-            
-        for future_name, future_value in exchange_value.items():
-            if not isinstance(future_value, dict):
-                module_logger.warning(f"Пропускаем фьючерс {future_name} на бирже {exchange_name}: данные не являются словарем")
-                continue
-                
-            # Создаем копию записи, чтобы не изменять исходные данные
-            record = future_value.copy()
-            record["exchange"] = exchange_name
-            record["symbol"] = future_name  # Добавляем имя символа для удобства
-            
-            # Безопасно удаляем поле info если оно существует
-            record.pop("info", None)
-            
-            result.append(record)
+        
+        # Копия записи с именем биржи и символа; исходные данные не изменяются
+        records = [
+            dict(future_value, exchange=exchange_name, symbol=future_name)
+            for future_name, future_value in exchange_value.items()
+            if isinstance(future_value, dict)
+        ]
+        
+        if len(records) != len(exchange_value):
+            for future_name, future_value in exchange_value.items():
+                if not isinstance(future_value, dict):
+                    module_logger.warning(f"Пропускаем фьючерс {future_name} на бирже {exchange_name}: данные не являются словарем")
+        
+        # Безопасно удаляем поле info если оно существует
+        for record in records:
+            record.pop(_INFO_KEY, None)
+        
+        result.extend(records)
     
     module_logger.info(f"Трансформировано {len(result)} записей из {len(data)} бирж")
     return result
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures and hooks for the Crypto Futures Price Collector v5 test suite.
+"""
+
+from .helpers import LOOP_FACTORIES, UVLOOP_AVAILABLE
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed, otherwise on the default loop.
+    
+    Tests that pass loop_factories to mark.asyncio get every available loop
+    and choose among them by name.
+    """
+    marker = item.get_closest_marker("asyncio")
+    if marker is not None and "loop_factories" in marker.kwargs:
+        return LOOP_FACTORIES
+    default = "uvloop" if UVLOOP_AVAILABLE else "asyncio"
+    return {default: LOOP_FACTORIES[default]}
@@ -0,0 +1,62 @@
+"""
+Shared helpers for the Crypto Futures Price Collector v5 test suite.
+Plain functions and constants; fixtures and hooks live in conftest.py.
+"""
+
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Event loop factories offered to pytest-asyncio, by name
+LOOP_FACTORIES = {"asyncio": asyncio.new_event_loop}
+if UVLOOP_AVAILABLE:
+    LOOP_FACTORIES["uvloop"] = uvloop.new_event_loop
+
+# Concurrency cap for fan-out benchmarks (mirrors performance.max_concurrent_requests)
+MAX_CONCURRENT_REQUESTS = 100
+
+
+def dumps(message: Dict[str, Any]) -> bytes:
+    """Serialize a message dict to a UTF-8 JSON body."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message)
+    return json.dumps(message).encode('utf-8')
+
+
+def loads(body: bytes) -> Dict[str, Any]:
+    """Decode a UTF-8 JSON message body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body.decode('utf-8'))
+
+
+async def gather_bounded(coros, limit: int = MAX_CONCURRENT_REQUESTS,
+                         return_exceptions: bool = False) -> List[Any]:
+    """Run coroutines in a TaskGroup with at most `limit` of them in flight."""
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def bounded(coro):
+        async with semaphore:
+            if not return_exceptions:
+                return await coro
+            try:
+                return await coro
+            except Exception as e:
+                return e
+    
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(bounded(coro)) for coro in coros]
+    return [task.result() for task in tasks]
@@ -3,13 +3,15 @@ Mock implementations for external APIs and services.
 Used for testing without real external dependencies.
 """
 
-from .exchange_mocks import MockExchangeFactory, MockCCXTExchange
+from .exchange_mocks import MockExchangeFactory, MockCCXTExchange, MockCCXTModule, install_mock_ccxt
 from .rabbitmq_mocks import MockRabbitMQClient, MockAsyncRabbitMQClient
 from .database_mocks import MockDatabaseClient
 
 __all__ = [
     'MockExchangeFactory',
     'MockCCXTExchange', 
+    'MockCCXTModule',
+    'install_mock_ccxt',
     'MockRabbitMQClient',
     'MockAsyncRabbitMQClient',
     'MockDatabaseClient'
@@ -6,7 +6,7 @@ Provides realistic mock behavior for testing database operations.
 import asyncio
 import json
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 from unittest.mock import AsyncMock, Mock
 from dataclasses import dataclass, field
 
@@ -133,8 +133,14 @@ class MockDatabaseClient:
         else:
             return []
     
-    async def insert_batch(self, table: str, records: List[Dict[str, Any]]) -> int:
-        """Mock batch insert operation."""
+    async def insert_batch(self, table: str,
+                           records: Sequence[Union[Dict[str, Any], Tuple]]) -> int:
+        """
+        Mock batch insert operation.
+        
+        Records are dicts or row tuples in table column order (the shape
+        clickhouse_connect's ``client.insert`` streams in one request).
+        """
         if not self.is_connected:
             raise ConnectionError("Not connected to database")
         
@@ -147,15 +153,20 @@ class MockDatabaseClient:
         if table not in self.tables:
             raise ValueError(f"Table {table} does not exist")
         
-        # Add records to mock table
-        for record in records:
-            mock_record = MockDatabaseRecord(
+        # Add records to mock table in one bulk append
+        table_records = self.tables[table]['records']
+        columns = self.tables[table]['columns']
+        first_id = len(table_records)
+        mock_records = [
+            MockDatabaseRecord(
                 table=table,
-                data=record,
-                id=f"{table}_{len(self.tables[table]['records'])}"
+                data=record if isinstance(record, dict) else dict(zip(columns, record)),
+                id=f"{table}_{first_id + offset}"
             )
-            self.tables[table]['records'].append(mock_record)
-            self.records.append(mock_record)
+            for offset, record in enumerate(records)
+        ]
+        table_records.extend(mock_records)
+        self.records.extend(mock_records)
         
         self.insert_count += len(records)
         return len(records)
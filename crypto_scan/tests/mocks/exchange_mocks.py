@@ -42,6 +42,8 @@ class MockCCXTExchange:
         self._call_count = 0
         self._last_call_time = 0
         self._failure_rate = 0.0  # Configurable failure rate for testing
+        self._network_delay = 0.05  # Base simulated network latency
+        self._jitter = 0.15  # Extra random latency on top of the base
         
     def _generate_mock_markets(self) -> Dict[str, Dict]:
         """Generate realistic mock market data."""
@@ -228,18 +230,20 @@ class MockCCXTExchange:
         self._call_count += 1
         current_time = time.time()
         
-        # Simulate rate limiting
+        # Simulate network delay
+        delay = self._network_delay + random.random() * self._jitter
+        
+        # Simulate rate limiting (folded into the same sleep)
         if self.enableRateLimit and self._last_call_time > 0:
             time_since_last = current_time - self._last_call_time
             min_interval = 1.0 / (self.rateLimit / 60)  # Convert per minute to per second
             
             if time_since_last < min_interval:
-                await asyncio.sleep(min_interval - time_since_last)
+                delay += min_interval - time_since_last
         
         self._last_call_time = current_time
         
-        # Simulate network delay
-        await asyncio.sleep(random.uniform(0.05, 0.2))
+        await asyncio.sleep(delay)
         
         # Simulate failures based on configured failure rate
         if random.random() < self._failure_rate:
@@ -256,6 +260,11 @@ class MockCCXTExchange:
         """Set the failure rate for testing error scenarios."""
         self._failure_rate = max(0.0, min(1.0, rate))
     
+    def set_delays(self, network_delay: float = 0.05, jitter: float = 0.15):
+        """Set simulated latency: each call sleeps network_delay plus up to jitter seconds."""
+        self._network_delay = network_delay
+        self._jitter = jitter
+    
     def get_call_statistics(self) -> Dict[str, Any]:
         """Get call statistics for testing."""
         return {
@@ -343,6 +352,31 @@ class MockExchangeFactory:
         return exchange
 
 
+class MockCCXTModule:
+    """
+    Stand-in for the ``ccxt`` / ``ccxt.async_support`` modules.
+    
+    Exchange classes resolve to constructors returning prepared mock exchanges;
+    every other attribute (exception classes etc.) is taken from the real module.
+    """
+    
+    def __init__(self, module: Any, exchanges: Dict[str, MockCCXTExchange]):
+        self._module = module
+        self._exchanges = exchanges
+    
+    def __getattr__(self, name: str) -> Any:
+        exchange = self._exchanges.get(name)
+        if exchange is None:
+            return getattr(self._module, name)
+        return lambda *args, **kwargs: exchange
+
+
+def install_mock_ccxt(monkeypatch, target: Any, exchanges: Dict[str, MockCCXTExchange]):
+    """Route the ``ccxt`` / ``ccxt_async`` lookups of module `target` to the given mock exchanges."""
+    monkeypatch.setattr(target, 'ccxt_async', MockCCXTModule(target.ccxt_async, exchanges))
+    monkeypatch.setattr(target, 'ccxt', MockCCXTModule(target.ccxt, exchanges))
+
+
 # Utility functions for testing
 def create_mock_ticker_data(symbol: str, base_price: float = 100.0) -> Dict[str, Any]:
     """Create realistic mock ticker data for a specific symbol."""
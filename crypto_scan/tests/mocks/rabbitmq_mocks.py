@@ -4,12 +4,13 @@ Provides realistic mock behavior for testing message queue operations.
 """
 
 import asyncio
-import json
 import time
 from typing import Dict, List, Any, Optional, Callable
 from unittest.mock import AsyncMock, Mock
 from dataclasses import dataclass, field
 
+from ..helpers import dumps, gather_bounded, loads
+
 
 @dataclass
 class MockMessage:
@@ -23,7 +24,7 @@ class MockMessage:
     
     def json(self) -> Dict[str, Any]:
         """Decode message body as JSON."""
-        return json.loads(self.body.decode('utf-8'))
+        return loads(self.body)
 
 
 class MockAsyncRabbitMQClient:
@@ -145,7 +146,7 @@ class MockAsyncRabbitMQClient:
         
         # Create mock message
         mock_message = MockMessage(
-            body=json.dumps(message).encode('utf-8'),
+            body=dumps(message),
             routing_key=routing_key,
             exchange=exchange_name,
             headers=kwargs.get('headers', {}),
@@ -179,6 +180,18 @@ class MockAsyncRabbitMQClient:
         
         return successful_publishes
     
+    async def publish_all(self, messages: List[Dict[str, Any]], 
+                          exchange_name: str, routing_key: str = "") -> int:
+        """Mock single-call publishing of all messages (bounded concurrent publishes)."""
+        if not self.is_connected:
+            raise ConnectionError("Not connected to RabbitMQ")
+        
+        await gather_bounded(
+            self.publish_message(exchange_name, routing_key, message)
+            for message in messages
+        )
+        return len(messages)
+    
     async def consume_messages(self, queue_name: str, callback: Callable, 
                              auto_ack: bool = True, **kwargs):
         """Mock message consumption."""
@@ -0,0 +1,203 @@
+"""
+Unit tests for TTLCache
+Tests cover CLOCK eviction, slot reuse, bulk insert overflow and the expiry heap.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import cache_manager
+from cache_manager import TTLCache
+
+
+class FakeClock:
+    """Stand-in for the time module inside cache_manager."""
+    
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+    
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Controllable clock patched into cache_manager only."""
+    fake = FakeClock()
+    with patch.object(cache_manager, "time", fake):
+        yield fake
+
+
+class TestTTLCacheEviction:
+    """Test suite for TTLCache CLOCK eviction."""
+    
+    def test_non_positive_max_size_rejected(self):
+        """A cache without ring positions cannot store anything."""
+        with pytest.raises(ValueError):
+            TTLCache(max_size=0)
+        with pytest.raises(ValueError):
+            TTLCache(max_size=-1)
+    
+    def test_unreferenced_entry_evicted_first(self):
+        """Entries read since the last sweep get a second chance."""
+        cache = TTLCache(max_size=3)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+        
+        cache.get('a')
+        cache.set('d', 'd')
+        
+        assert cache.get('b') is None
+        assert [cache.get(key) for key in ('a', 'c', 'd')] == ['a', 'c', 'd']
+        assert cache.get_stats().evictions == 1
+    
+    def test_hand_continues_from_last_position(self):
+        """The next eviction resumes after the previous victim."""
+        cache = TTLCache(max_size=3)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+        cache.get('a')
+        cache.set('d', 'd')  # evicts 'b', clears the reference bit of 'a'
+        
+        cache.set('e', 'e')
+        
+        assert cache.get('c') is None
+        assert [cache.get(key) for key in ('a', 'd', 'e')] == ['a', 'd', 'e']
+    
+    def test_overwrite_keeps_slot_and_does_not_evict(self):
+        """Updating an existing key reuses its ring position."""
+        cache = TTLCache(max_size=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        slot = cache._cache['a'].slot
+        
+        cache.set('a', 3)
+        
+        assert cache._cache['a'].slot == slot
+        assert cache.get('a') == 3
+        assert cache.get('b') == 2
+        assert cache.get_stats().evictions == 0
+    
+    def test_deleted_slot_reused_without_eviction(self):
+        """A freed position is handed to the next new key."""
+        cache = TTLCache(max_size=3)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+        slot = cache._cache['b'].slot
+        
+        assert cache.delete('b')
+        cache.set('x', 'x')
+        
+        assert cache._cache['x'].slot == slot
+        assert cache._clock_keys[slot] == 'x'
+        assert cache.get_stats().evictions == 0
+        assert cache.get_stats().size == 3
+    
+    def test_set_many_evicts_only_for_new_keys(self):
+        """Keys being overwritten by set_many are never evicted to make room."""
+        cache = TTLCache(max_size=3)
+        for key in ('a', 'b', 'c'):
+            cache.set(key, key)
+        
+        cache.set_many({'c': 'C', 'd': 'd', 'e': 'e'})
+        
+        assert cache.get('a') is None
+        assert cache.get('b') is None
+        assert [cache.get(key) for key in ('c', 'd', 'e')] == ['C', 'd', 'e']
+        assert cache.get_stats().evictions == 2
+    
+    def test_set_many_larger_than_cache_keeps_last_items(self):
+        """Only the last max_size items of an oversized batch are stored."""
+        cache = TTLCache(max_size=2)
+        cache.set('a', 'a')
+        
+        cache.set_many({'x': 1, 'y': 2, 'z': 3})
+        
+        assert cache.get_many(['a', 'x', 'y', 'z']) == [None, None, 2, 3]
+        assert cache.get_stats().size == 2
+        assert cache._free_slots == []
+
+
+class TestTTLCacheExpiry:
+    """Test suite for the TTLCache expiry heap."""
+    
+    def test_cleanup_removes_only_due_entries(self, clock):
+        """Cleanup pops due deadlines and leaves later ones in the heap."""
+        cache = TTLCache(max_size=10)
+        cache.set('short', 1, ttl=10)
+        cache.set('long', 2, ttl=100)
+        
+        clock.now += 50
+        cache._cleanup_expired()
+        
+        assert 'short' not in cache._cache
+        assert cache.get('long') == 2
+        assert [key for _, key in cache._expiry] == ['long']
+        assert cache.get_stats().evictions == 1
+    
+    def test_cleanup_before_deadline_is_noop(self, clock):
+        """Nothing is popped while the earliest deadline is in the future."""
+        cache = TTLCache(max_size=10)
+        cache.set('a', 1, ttl=10)
+        
+        clock.now += 5
+        cache._cleanup_expired()
+        
+        assert cache.get('a') == 1
+        assert len(cache._expiry) == 1
+    
+    def test_stale_deadline_after_overwrite_keeps_entry(self, clock):
+        """The old deadline of an overwritten key does not remove the new value."""
+        cache = TTLCache(max_size=10)
+        cache.set('a', 'old', ttl=10)
+        clock.now += 5
+        cache.set('a', 'new', ttl=100)
+        assert len(cache._expiry) == 2
+        
+        clock.now += 20
+        cache._cleanup_expired()
+        
+        assert cache.get('a') == 'new'
+        assert len(cache._expiry) == 1
+        assert cache.get_stats().evictions == 0
+    
+    def test_stale_deadline_after_delete_is_discarded(self, clock):
+        """A deadline left behind by delete() is dropped without side effects."""
+        cache = TTLCache(max_size=10)
+        cache.set('a', 1, ttl=10)
+        cache.delete('a')
+        
+        clock.now += 20
+        cache._cleanup_expired()
+        
+        assert cache._expiry == []
+        assert cache.get_stats().evictions == 0
+    
+    def test_heap_rebuilt_after_4x_max_size_pushes(self, clock):
+        """Repeated overwrites never grow the heap past 4 * max_size."""
+        cache = TTLCache(max_size=2)
+        
+        for i in range(4 * cache.max_size):
+            cache.set('a', i, ttl=10)
+        assert len(cache._expiry) == 4 * cache.max_size
+        
+        cache.set('a', 'last', ttl=10)
+        
+        # Rebuilt from live entries: one deadline per cached key
+        assert cache._expiry == [(clock.now + 10, 'a')]
+        assert cache.get('a') == 'last'
+    
+    def test_rebuilt_heap_still_expires_entries(self, clock):
+        """Deadlines survive the rebuild and are honoured by cleanup."""
+        cache = TTLCache(max_size=2)
+        cache.set('b', 'b', ttl=100)
+        for i in range(4 * cache.max_size):
+            cache.set('a', i, ttl=10)
+        
+        clock.now += 50
+        cache._cleanup_expired()
+        
+        assert 'a' not in cache._cache
+        assert cache.get('b') == 'b'
+        assert [key for _, key in cache._expiry] == ['b']
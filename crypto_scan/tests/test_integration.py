@@ -5,25 +5,91 @@ Tests component interactions and end-to-end system behavior.
 
 import pytest
 import asyncio
+import dataclasses
+import logging
+import random
 import time
-from typing import Dict, List, Any
-from unittest.mock import patch, Mock, AsyncMock
+from typing import Dict
 
-from tests.mocks.exchange_mocks import MockExchangeFactory, MockCCXTExchange
+from tests.mocks.exchange_mocks import MockExchangeFactory, MockCCXTExchange, install_mock_ccxt
 from tests.mocks.rabbitmq_mocks import MockAsyncRabbitMQClient
 from tests.mocks.database_mocks import MockDatabaseClient
 
 # Import system components
+import exchange_manager_v3
 from config_manager import ConfigManager, AppConfig
-from exchange_manager_v3 import ResilientExchangeManager
-from circuit_breaker import CircuitBreakerManager
-from retry_manager import RetryManagerRegistry
-from health_monitor import HealthMonitor
+from exchange_manager_v3 import ResilientExchangeManager, ExchangeConfig
+from circuit_breaker import CircuitBreakerManager, CircuitBreakerConfig, CircuitBreakerError, CircuitState
+from retry_manager import RetryManagerRegistry, RetryConfig, RetryStrategy
 from cache_manager import CacheManager
-from batch_processor import BatchProcessorManager
-from connection_pool import ConnectionPoolManager
-from data_collector import DataCollector
-from data_sender import DataSender
+from batch_processor import BatchProcessorManager, BatchConfig, BatchStrategy
+# data_collector / data_sender use package-relative imports
+from packages.data_collector import DataCollector
+from packages.data_sender import DataSender
+
+logger = logging.getLogger(__name__)
+
+# Shared bulk payload for memory-pressure entries: one string reused by every entry
+_BULK_PAYLOAD = 'x' * 1000
+_BULK_TEMPLATE = {'large_data': _BULK_PAYLOAD}
+
+# Resilience settings for mock exchanges: retry plain mock errors without real backoff sleeps
+FAST_RETRY = RetryConfig(
+    max_attempts=3,
+    base_delay=0.01,
+    max_delay=0.05,
+    strategy=RetryStrategy.EXPONENTIAL,
+    jitter=False,
+    retryable_exceptions=(Exception,)
+)
+FAST_BREAKER = CircuitBreakerConfig(failure_threshold=10, recovery_timeout=1.0, success_threshold=2, timeout=5.0)
+BASE_EXCHANGE_CONFIG = ExchangeConfig(
+    name='binance',
+    rate_limit=1000,
+    retry_config=FAST_RETRY,
+    circuit_breaker_config=FAST_BREAKER
+)
+
+
+def exchange_configs(names) -> list:
+    """Per-exchange ResilientExchangeManager configs cloned from BASE_EXCHANGE_CONFIG."""
+    return [dataclasses.replace(BASE_EXCHANGE_CONFIG, name=name) for name in names]
+
+
+def fast_mock_exchange(name: str) -> MockCCXTExchange:
+    """Mock exchange with millisecond latencies."""
+    exchange = MockCCXTExchange(name)
+    exchange.set_delays(0.001, 0.001)
+    return exchange
+
+
+@pytest.fixture(autouse=True)
+def seed_mock_randomness():
+    """Mocks draw failures and latencies from `random`; seed it so outcomes are reproducible."""
+    random.seed(1234)
+
+
+class PipelineDispatcher:
+    """DataSender dispatcher that fans collected data out to the mock broker and database."""
+    
+    def __init__(self, rabbitmq_client: MockAsyncRabbitMQClient, database_client: MockDatabaseClient):
+        self.rabbitmq_client = rabbitmq_client
+        self.database_client = database_client
+    
+    async def set_data(self, data: Dict) -> None:
+        await self.rabbitmq_client.publish_message('crypto_data', 'ticker', data)
+        rows = [
+            {
+                'timestamp': ticker['timestamp'],
+                'exchange': exchange,
+                'symbol': symbol,
+                'price': ticker['last'],
+                'volume': ticker['baseVolume']
+            }
+            for exchange, tickers in data['tickers'].items()
+            for symbol, ticker in tickers.items()
+        ]
+        await self.database_client.insert_batch('tickers', rows)
 
 
 class TestSystemIntegration:
@@ -37,7 +103,7 @@ class TestSystemIntegration:
             "debug": True,
             "exchanges": ["binance", "bybit"],
             "ticker_interval": 5.0,
-            "funding_rate_interval": 30.0,
+            "funding_rate_interval": 60.0,
             "cache": {
                 "enabled": True,
                 "default_ttl": 60.0,
@@ -63,110 +129,94 @@ class TestSystemIntegration:
         }
     
     @pytest.fixture
-    async def integrated_system(self, integration_config):
+    async def integrated_system(self, integration_config, monkeypatch):
         """Create fully integrated system for testing."""
         config = AppConfig(**integration_config)
         
         # Initialize all components
         cache_manager = CacheManager()
-        connection_pool = ConnectionPoolManager()
         batch_processor = BatchProcessorManager()
-        circuit_breaker_manager = CircuitBreakerManager()
-        retry_manager = RetryManagerRegistry()
-        health_monitor = HealthMonitor()
         
-        # Initialize exchange manager
+        # The exchange manager owns its circuit breakers, retry managers and health monitor
         exchange_manager = ResilientExchangeManager()
-        exchange_manager.set_resilience_components(
-            circuit_breaker_manager=circuit_breaker_manager,
-            retry_manager=retry_manager,
-            health_monitor=health_monitor,
-            cache_manager=cache_manager,
-            connection_pool=connection_pool
-        )
         
         # Initialize data components
         rabbitmq_client = MockAsyncRabbitMQClient(**config.rabbitmq.model_dump())
         database_client = MockDatabaseClient(**config.database.model_dump())
         
-        data_collector = DataCollector(
-            exchange_manager=exchange_manager,
-            cache_manager=cache_manager,
-            config=config
-        )
-        
-        data_sender = DataSender(
-            rabbitmq_client=rabbitmq_client,
-            database_client=database_client,
-            batch_processor=batch_processor,
-            config=config
-        )
+        data_collector = DataCollector(exchange_manager)
+        data_sender = DataSender(PipelineDispatcher(rabbitmq_client, database_client))
         
         # Mock exchange initialization
-        with patch('exchange_manager_v3.getattr') as mock_getattr:
-            mock_exchange_class = AsyncMock()
-            mock_exchange_instance = MockExchangeFactory.create_exchange('binance')
-            mock_exchange_class.return_value = mock_exchange_instance
-            mock_getattr.return_value = mock_exchange_class
-            
-            # Initialize exchanges
-            exchange_configs = [config.get_exchange_config(name) for name in config.exchanges]
-            await exchange_manager.initialize_exchanges(exchange_configs)
+        install_mock_ccxt(monkeypatch, exchange_manager_v3, {
+            name: fast_mock_exchange(name) for name in config.exchanges
+        })
+        
+        # Initialize exchanges
+        await exchange_manager.initialize_exchanges(exchange_configs(config.exchanges))
         
         # Start components
+        await cache_manager.start()
+        await batch_processor.start()
         await rabbitmq_client.start()
         await database_client.connect()
-        await health_monitor.start()
         
         system = {
             'config': config,
             'exchange_manager': exchange_manager,
             'data_collector': data_collector,
             'data_sender': data_sender,
+            'batch_processor': batch_processor,
             'rabbitmq_client': rabbitmq_client,
             'database_client': database_client,
             'cache_manager': cache_manager,
-            'health_monitor': health_monitor,
-            'circuit_breaker_manager': circuit_breaker_manager,
-            'retry_manager': retry_manager
+            'health_monitor': exchange_manager.health_monitor,
+            'circuit_breaker_manager': exchange_manager.circuit_breaker_manager,
+            'retry_registry': exchange_manager.retry_registry
         }
         
         yield system
         
-        # Cleanup
-        await exchange_manager.close_all()
-        await health_monitor.stop()
-        await rabbitmq_client.stop()
-        await database_client.disconnect()
+        # Cleanup: independent shutdowns run concurrently
+        results = await asyncio.gather(
+            exchange_manager.close_all(),
+            cache_manager.stop(),
+            batch_processor.stop(),
+            rabbitmq_client.stop(),
+            database_client.disconnect(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Integrated system teardown error: {result}")
     
     @pytest.mark.asyncio
     async def test_end_to_end_data_flow(self, integrated_system):
         """Test complete data flow from collection to storage."""
         system = integrated_system
+        exchanges = system['config'].exchanges
         
         # Collect data
-        collected_data = await system['data_collector'].collect_all_data()
+        collected_data = await system['data_collector'].collect_all_data(exchanges)
         
         # Verify data collection
-        assert 'tickers' in collected_data
-        assert 'funding_rates' in collected_data
-        assert len(collected_data['tickers']) > 0
+        assert set(collected_data['tickers']) == set(exchanges)
+        assert all(collected_data['tickers'].values())
+        assert collected_data['metadata']['successful_ticker_exchanges'] == len(exchanges)
+        assert collected_data['metadata']['successful_funding_exchanges'] == len(exchanges)
         
         # Send data through the pipeline
-        await system['data_sender'].send_tickers(collected_data['tickers'])
-        await system['data_sender'].send_funding_rates(collected_data['funding_rates'])
+        assert await system['data_sender'].send_data(collected_data)
         
         # Verify data was sent to RabbitMQ
         rabbitmq_stats = system['rabbitmq_client'].get_statistics()
-        assert rabbitmq_stats['publish_count'] > 0
+        assert rabbitmq_stats['publish_count'] == 1
         
-        # Verify data was stored in database
+        # Verify every collected ticker was stored in the database
+        total_tickers = sum(len(tickers) for tickers in collected_data['tickers'].values())
         db_stats = system['database_client'].get_statistics()
-        assert db_stats['insert_count'] > 0
-        
-        # Check cache usage
-        cache_stats = system['cache_manager'].get_cache_stats()
-        assert cache_stats['ticker']['hits'] + cache_stats['ticker']['misses'] > 0
+        assert db_stats['insert_count'] == total_tickers
+        assert system['data_sender'].get_send_stats()['successful_sends'] == 1
     
     @pytest.mark.asyncio
     async def test_resilience_integration(self, integrated_system):
@@ -175,35 +225,30 @@ class TestSystemIntegration:
         
         # Get resilience components
         cb_manager = system['circuit_breaker_manager']
-        retry_manager = system['retry_manager']
+        retry_registry = system['retry_registry']
         health_monitor = system['health_monitor']
         
         # Simulate exchange failures
         exchange = system['exchange_manager'].get_exchange('binance')
-        if hasattr(exchange, 'ccxt_exchange'):
-            exchange.ccxt_exchange.set_failure_rate(0.5)  # 50% failure rate
+        exchange.async_exchange.set_failure_rate(0.5)  # 50% failure rate
         
         # Collect data multiple times to trigger resilience mechanisms
         results = []
         for _ in range(10):
-            try:
-                data = await system['data_collector'].collect_ticker_data(['binance'])
-                results.append(data)
-            except Exception as e:
-                results.append(e)
+            collected = await system['data_collector'].collect_tickers(['binance'])
+            results.append(collected['binance'])
             
-            await asyncio.sleep(0.1)  # Small delay between attempts
+            await asyncio.sleep(0)  # Yield to the loop; the mock exchange has no real rate limit
         
         # Verify resilience mechanisms activated
-        cb_states = cb_manager.get_all_states()
-        assert len(cb_states) > 0
+        assert 'exchange_binance' in cb_manager.get_all_status()
+        assert retry_registry.get_manager('exchange_binance').stats.total_retries > 0
         
         # Check health monitor status
-        health_status = health_monitor.get_all_health_status()
-        assert len(health_status) > 0
+        assert 'exchange_binance' in health_monitor.get_all_status()
         
         # Verify some successful results despite failures
-        successful_results = [r for r in results if not isinstance(r, Exception)]
+        successful_results = [r for r in results if r.success]
         assert len(successful_results) > 0, "Resilience mechanisms should allow some success"
     
     @pytest.mark.asyncio
@@ -213,47 +258,67 @@ class TestSystemIntegration:
         cache_manager = system['cache_manager']
         data_collector = system['data_collector']
         
-        # First data collection (should populate cache)
-        data1 = await data_collector.collect_ticker_data(['binance'])
+        # First data collection populates the ticker cache, keyed by symbol
+        collected = await data_collector.collect_tickers(['binance'])
+        tickers = collected['binance'].data
+        cache_manager.set_many('tickers', tickers)
         
-        # Check cache was populated
-        cache_stats_before = cache_manager.get_cache_stats()
+        hits_before = cache_manager.get_all_stats()['tickers'].hits
         
-        # Second data collection (should use cache)
-        data2 = await data_collector.collect_ticker_data(['binance'])
-        
-        # Check cache usage
-        cache_stats_after = cache_manager.get_cache_stats()
+        # Later reads are served from the cache
+        cached = cache_manager.get_many('tickers', tickers)
+        assert cached == list(tickers.values())
         
         # Verify cache hits increased
-        if 'ticker' in cache_stats_after:
-            assert cache_stats_after['ticker']['hits'] >= cache_stats_before.get('ticker', {}).get('hits', 0)
+        cache_stats_after = cache_manager.get_all_stats()['tickers']
+        assert cache_stats_after.hits == hits_before + len(tickers)
+        assert cache_stats_after.size == len(tickers)
     
     @pytest.mark.asyncio
     async def test_batch_processing_integration(self, integrated_system):
         """Test batch processing integration."""
         system = integrated_system
-        data_sender = system['data_sender']
+        rabbitmq_client = system['rabbitmq_client']
+        database_client = system['database_client']
+        
+        async def deliver(batch):
+            records = [item.data for item in batch]
+            await rabbitmq_client.publish_batch(records, 'crypto_data', 'ticker')
+            await database_client.insert_batch('tickers', records)
+        
+        processor = await system['batch_processor'].create_processor(
+            'tickers',
+            BatchConfig(max_batch_size=100, max_wait_time=0.1, strategy=BatchStrategy.SIZE_BASED),
+            deliver
+        )
         
         # Generate large dataset
+        base_timestamp = time.time_ns() // 1_000_000
+        symbols = list(map('BTC/USDT_%d'.__mod__, range(500)))
         large_dataset = []
-        for i in range(500):
+        for i, symbol in enumerate(symbols):
             large_dataset.append({
-                'timestamp': int(time.time() * 1000),
+                'timestamp': base_timestamp + i,
                 'exchange': 'binance',
-                'symbol': f'BTC/USDT_{i}',
+                'symbol': symbol,
                 'price': 50000 + i,
                 'volume': 1000 + i
             })
         
-        # Send data (should be batched)
-        await data_sender.send_tickers(large_dataset)
+        # Queue data (should be batched)
+        await processor.add_items([(record, 'binance', 0) for record in large_dataset])
+        async with asyncio.timeout(10):
+            while processor.get_stats().total_items < len(large_dataset):
+                await asyncio.sleep(0.01)
         
         # Verify batching occurred
-        rabbitmq_stats = system['rabbitmq_client'].get_statistics()
-        db_stats = system['database_client'].get_statistics()
+        batch_stats = processor.get_stats()
+        assert batch_stats.total_batches == len(large_dataset) // 100
+        assert batch_stats.failed_batches == 0
         
         # Should have processed all data
+        rabbitmq_stats = rabbitmq_client.get_statistics()
+        db_stats = database_client.get_statistics()
         assert rabbitmq_stats['publish_count'] == len(large_dataset)
         assert db_stats['insert_count'] == len(large_dataset)
     
@@ -287,98 +352,103 @@ class TestFailureScenarios:
         """Test system behavior when exchanges fail and recover."""
         # Create exchange that will fail initially
         failing_exchange = MockExchangeFactory.create_failing_exchange('binance', failure_rate=1.0)
+        failing_exchange.set_delays(0.001, 0.001)
         
         # Create resilience components
         circuit_breaker_manager = CircuitBreakerManager()
-        retry_manager = RetryManagerRegistry()
+        retry_registry = RetryManagerRegistry()
         
-        cb = circuit_breaker_manager.create_circuit_breaker('exchange_binance', {
-            'failure_threshold': 3,
-            'recovery_timeout': 5.0,
-            'success_threshold': 2
-        })
+        cb = circuit_breaker_manager.get_breaker('exchange_binance', CircuitBreakerConfig(
+            failure_threshold=3,
+            recovery_timeout=0.1,
+            success_threshold=2
+        ))
+        rm = retry_registry.get_manager('exchange_binance', FAST_RETRY)
         
-        rm = retry_manager.create_retry_manager('exchange_binance', {
-            'max_attempts': 3,
-            'base_delay': 0.1,
-            'strategy': 'exponential'
-        })
+        # Same layering as ResilientExchange: the breaker wraps the retry loop
+        async def fetch():
+            return await cb.call(rm.execute_with_retry, failing_exchange.fetch_tickers)
         
         # Test initial failures
-        failure_count = 0
+        failures = []
         for _ in range(5):
             try:
-                await rm.call(lambda: cb.call(failing_exchange.fetch_tickers))
-            except Exception:
-                failure_count += 1
+                await fetch()
+            except Exception as e:
+                failures.append(e)
         
-        assert failure_count == 5, "All calls should fail initially"
+        assert len(failures) == 5, "All calls should fail initially"
+        assert isinstance(failures[-1], CircuitBreakerError), "Breaker should open after repeated failures"
+        assert cb.state == CircuitState.OPEN
         
         # Simulate exchange recovery
         failing_exchange.set_failure_rate(0.0)  # Exchange recovers
         
-        # Wait for circuit breaker recovery timeout
-        await asyncio.sleep(6.0)
+        # Wait for circuit breaker recovery timeout (adapted upwards when it opened)
+        await asyncio.sleep(cb.get_status()['config']['current_recovery_timeout'])
         
         # Test recovery
         success_count = 0
         for _ in range(5):
             try:
-                result = await rm.call(lambda: cb.call(failing_exchange.fetch_tickers))
+                result = await fetch()
                 if result:
                     success_count += 1
             except Exception:
                 pass
         
         assert success_count > 0, "Some calls should succeed after recovery"
+        assert cb.state == CircuitState.CLOSED
     
     @pytest.mark.asyncio
     async def test_rabbitmq_connection_failure(self):
         """Test behavior when RabbitMQ connection fails."""
-        rabbitmq_client = MockAsyncRabbitMQClient()
-        rabbitmq_client.set_failure_rate(0.3)  # 30% connection failure rate
-        
-        # Test connection resilience
-        connection_attempts = 0
-        successful_connections = 0
-        
-        for _ in range(10):
-            connection_attempts += 1
+        async def connection_attempt() -> bool:
+            # Separate client per attempt: concurrent attempts must not share connection state
+            rabbitmq_client = MockAsyncRabbitMQClient()
+            rabbitmq_client.set_failure_rate(0.3)  # 30% connection failure rate
             try:
                 await rabbitmq_client.connect()
-                successful_connections += 1
                 await rabbitmq_client.disconnect()
+                return True
             except Exception:
-                pass
+                return False
+        
+        # Test connection resilience
+        results = await asyncio.gather(*(connection_attempt() for _ in range(10)))
         
         # Should have some successful connections despite failures
-        success_rate = successful_connections / connection_attempts
+        success_rate = sum(results) / len(results)
         assert success_rate > 0.5, f"Connection success rate too low: {success_rate:.1%}"
     
     @pytest.mark.asyncio
     async def test_database_connection_failure(self):
         """Test behavior when database connection fails."""
-        db_client = MockDatabaseClient()
-        db_client.set_failure_rate(0.2)  # 20% failure rate
-        
-        # Test database operation resilience
-        operation_attempts = 0
-        successful_operations = 0
-        
-        for _ in range(20):
-            operation_attempts += 1
+        # Each operation is retried: two independent 20% failure points alone would
+        # succeed only ~64% of the time
+        retry_manager = RetryManagerRegistry().get_manager('database', FAST_RETRY)
+        
+        async def operation_attempt() -> bool:
+            # Separate client per attempt: concurrent attempts must not share connection state
+            db_client = MockDatabaseClient()
+            db_client.set_failure_rate(0.2)  # 20% failure rate
             try:
-                await db_client.connect()
+                await retry_manager.execute_with_retry(db_client.connect)
                 await db_client.create_table('test_table', ['id', 'data'])
-                await db_client.insert_batch('test_table', [{'id': 1, 'data': 'test'}])
-                successful_operations += 1
-                await db_client.disconnect()
+                await retry_manager.execute_with_retry(
+                    db_client.insert_batch, 'test_table', [{'id': 1, 'data': 'test'}]
+                )
             except Exception:
-                pass
+                return False
+            await db_client.disconnect()
+            return True
+        
+        # Test database operation resilience
+        results = await asyncio.gather(*(operation_attempt() for _ in range(20)))
         
-        # Should have some successful operations despite failures
-        success_rate = successful_operations / operation_attempts
-        assert success_rate > 0.6, f"Database success rate too low: {success_rate:.1%}"
+        # Retries should carry almost every operation through the failures
+        success_rate = sum(results) / len(results)
+        assert success_rate > 0.9, f"Database success rate too low: {success_rate:.1%}"
     
     @pytest.mark.asyncio
     async def test_memory_pressure_scenario(self):
@@ -387,106 +457,84 @@ class TestFailureScenarios:
         
         # Create components
         cache_manager = CacheManager()
-        
-        # Simulate memory pressure by filling cache
-        for i in range(20000):  # Exceed cache limits
-            cache_manager.set('ticker', f'symbol_{i}', {
-                'price': 50000 + i,
-                'volume': 1000 + i,
-                'large_data': 'x' * 1000  # Add some bulk to each entry
-            })
-        
-        # Force garbage collection
-        gc.collect()
-        
-        # Verify cache still functions (should have evicted old entries)
-        cache_stats = cache_manager.get_cache_stats()
-        
-        # Cache should not grow indefinitely
-        total_entries = sum(stats.get('size', 0) for stats in cache_stats.values())
-        assert total_entries < 15000, f"Cache size not properly limited: {total_entries}"
-        
-        # Cache should still be functional
-        cache_manager.set('ticker', 'test_symbol', {'price': 100})
-        result = cache_manager.get('ticker', 'test_symbol')
-        assert result is not None, "Cache should still be functional under pressure"
+        await cache_manager.start()
+        
+        try:
+            # Simulate memory pressure by filling cache
+            keys = list(map('symbol_%d'.__mod__, range(20000)))
+            for i, key in enumerate(keys):  # Exceed cache limits
+                cache_manager.set('tickers', key, {
+                    **_BULK_TEMPLATE,
+                    'price': 50000 + i,
+                    'volume': 1000 + i
+                })
+            
+            # Force garbage collection
+            gc.collect()
+            
+            # Verify cache still functions (should have evicted old entries)
+            cache_stats = cache_manager.get_all_stats()
+            
+            # Cache should not grow indefinitely
+            total_entries = sum(stats.size for stats in cache_stats.values())
+            assert total_entries < 15000, f"Cache size not properly limited: {total_entries}"
+            assert cache_stats['tickers'].evictions > 0
+            
+            # Cache should still be functional
+            cache_manager.set('tickers', 'test_symbol', {'price': 100})
+            result = cache_manager.get('tickers', 'test_symbol')
+            assert result is not None, "Cache should still be functional under pressure"
+        finally:
+            await cache_manager.stop()
 
 
 class TestScalabilityScenarios:
     """Integration tests for system scalability."""
     
     @pytest.mark.asyncio
-    async def test_multiple_exchange_scaling(self):
+    async def test_multiple_exchange_scaling(self, monkeypatch):
         """Test system behavior with many exchanges."""
         # Create many mock exchanges
-        exchanges = {}
         exchange_names = ['binance', 'bybit', 'bitget', 'htx', 'gateio', 'okx', 'kucoin', 'mexc']
+        exchanges = {name: fast_mock_exchange(name) for name in exchange_names}
         
-        for name in exchange_names:
-            exchanges[name] = MockExchangeFactory.create_exchange(name)
-        
-        # Create exchange manager
+        # Create exchange manager with its own resilience components
         exchange_manager = ResilientExchangeManager()
         
-        # Mock resilience components
-        circuit_breaker_manager = CircuitBreakerManager()
-        retry_manager = RetryManagerRegistry()
-        health_monitor = HealthMonitor()
-        cache_manager = CacheManager()
-        connection_pool = ConnectionPoolManager()
-        
-        exchange_manager.set_resilience_components(
-            circuit_breaker_manager=circuit_breaker_manager,
-            retry_manager=retry_manager,
-            health_monitor=health_monitor,
-            cache_manager=cache_manager,
-            connection_pool=connection_pool
-        )
-        
         # Mock exchange initialization for all exchanges
-        with patch('exchange_manager_v3.getattr') as mock_getattr:
-            def mock_exchange_factory(exchange_id):
-                return lambda **kwargs: exchanges[exchange_id]
+        install_mock_ccxt(monkeypatch, exchange_manager_v3, exchanges)
+        
+        try:
+            # Initialize all exchanges
+            init_results = await exchange_manager.initialize_exchanges(exchange_configs(exchange_names))
             
-            mock_getattr.side_effect = lambda ccxt_module, exchange_id: mock_exchange_factory(exchange_id)
+            # Verify all exchanges were initialized
+            assert len(exchange_manager.exchanges) == len(exchange_names)
+            assert all(init_results.values())
             
-            # Create exchange configs
-            from config_manager import ExchangeConfig
-            exchange_configs = [
-                ExchangeConfig(name=name, enabled=True, timeout=30.0, rate_limit=1000)
-                for name in exchange_names
-            ]
+            # Test concurrent operations on all exchanges
+            start_time = time.time()
+            tasks = []
             
-            # Initialize all exchanges
-            await exchange_manager.initialize_exchanges(exchange_configs)
-        
-        # Verify all exchanges were initialized
-        assert len(exchange_manager.exchanges) == len(exchange_names)
-        
-        # Test concurrent operations on all exchanges
-        start_time = time.time()
-        tasks = []
-        
-        for exchange_name in exchange_names:
-            exchange = exchange_manager.get_exchange(exchange_name)
-            if exchange:
-                tasks.append(exchange.fetch_tickers())
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        end_time = time.time()
-        
-        # Verify performance scales reasonably
-        total_time = end_time - start_time
-        assert total_time < 10.0, f"Multi-exchange operations too slow: {total_time:.2f}s"
-        
-        # Verify most operations succeeded
-        successful_results = [r for r in results if not isinstance(r, Exception)]
-        success_rate = len(successful_results) / len(results)
-        assert success_rate > 0.8, f"Success rate too low with many exchanges: {success_rate:.1%}"
-        
-        # Cleanup
-        await exchange_manager.close_all()
-        await health_monitor.stop()
+            for exchange_name in exchange_names:
+                exchange = exchange_manager.get_exchange(exchange_name)
+                if exchange:
+                    tasks.append(exchange.fetch_tickers())
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            end_time = time.time()
+            
+            # Verify performance scales reasonably
+            total_time = end_time - start_time
+            assert total_time < 10.0, f"Multi-exchange operations too slow: {total_time:.2f}s"
+            
+            # Verify most operations succeeded (failed fetches come back as None)
+            successful_results = [r for r in results if r and not isinstance(r, Exception)]
+            success_rate = len(successful_results) / len(results)
+            assert success_rate > 0.8, f"Success rate too low with many exchanges: {success_rate:.1%}"
+        finally:
+            # Cleanup: also stops the manager's health monitor
+            await exchange_manager.close_all()
     
     @pytest.mark.asyncio
     async def test_high_throughput_scenario(self):
@@ -498,18 +546,19 @@ class TestScalabilityScenarios:
         db_client = MockDatabaseClient()
         db_client.set_delays(0.001, 0.0001)  # Very fast
         
-        batch_processor = BatchProcessorManager()
-        
         await rabbitmq_client.start()
         await db_client.connect()
         
         # Generate high-volume data
+        base_timestamp = time.time_ns() // 1_000_000
+        exchange_names = list(map('exchange_%d'.__mod__, range(5)))
+        symbols = list(map('BTC/USDT_%d'.__mod__, range(100)))
         high_volume_data = []
         for i in range(10000):
             high_volume_data.append({
-                'timestamp': int(time.time() * 1000),
-                'exchange': f'exchange_{i % 5}',
-                'symbol': f'BTC/USDT_{i % 100}',
+                'timestamp': base_timestamp + i,
+                'exchange': exchange_names[i % 5],
+                'symbol': symbols[i % 100],
                 'price': 50000 + (i % 1000),
                 'volume': 1000 + (i % 500)
             })
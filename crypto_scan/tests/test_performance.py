@@ -5,26 +5,108 @@ Tests system performance under various load conditions and stress scenarios.
 
 import pytest
 import asyncio
+import contextlib
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import psutil
 import statistics
-from typing import Dict, List, Any, Tuple
-from unittest.mock import patch, Mock, AsyncMock
+import numpy as np
+from typing import Dict, Any, Tuple
 
-from tests.mocks.exchange_mocks import MockExchangeFactory, MockCCXTExchange
+from tests.helpers import MAX_CONCURRENT_REQUESTS, gather_bounded
+from tests.mocks.exchange_mocks import MockExchangeFactory, MockCCXTExchange, install_mock_ccxt
 from tests.mocks.rabbitmq_mocks import MockAsyncRabbitMQClient
 from tests.mocks.database_mocks import MockDatabaseClient
 
 # Import system components for testing
+import exchange_manager_v3
 from config_manager import ConfigManager, AppConfig
-from exchange_manager_v3 import ResilientExchangeManager
-from circuit_breaker import CircuitBreakerManager
-from retry_manager import RetryManagerRegistry
-from health_monitor import HealthMonitor
+from exchange_manager_v3 import ResilientExchangeManager, ExchangeConfig
+from circuit_breaker import CircuitBreakerManager, CircuitBreakerConfig
+from retry_manager import RetryManagerRegistry, RetryConfig, RetryStrategy
 from cache_manager import CacheManager
 from batch_processor import BatchProcessorManager
 from connection_pool import ConnectionPoolManager
 
+# One handle for all memory measurements: creating psutil.Process() re-reads /proc each time
+_PROC = psutil.Process()
+
+# Symbol names formatted once per module instead of inside every data loop
+_SYMS_100 = tuple(f'BTC/USDT_{i}' for i in range(100))
+_SYMS_10K = tuple(f'BTC/USDT_{i}' for i in range(10_000))
+
+
+def elapsed_seconds(start_ns: int) -> float:
+    """Seconds since a time.perf_counter_ns() reading (monotonic, integer-based)."""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def _batch_columns(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Price/volume columns for batch-processing records."""
+    row_ids = np.arange(count)
+    return 50000 + row_ids % 1000, 1000 + row_ids % 500
+
+
+def _ticker_rows(count: int, columns: Tuple[str, ...]) -> Tuple[Dict[str, Any], ...]:
+    """Ticker rows built column-wise with numpy and zipped into dicts once at the end."""
+    row_ids = np.arange(count)
+    data = {
+        'timestamp': np.full(count, time.time_ns() // 1_000_000, dtype=np.int64),
+        'exchange': np.full(count, 'binance'),
+        'symbol': np.asarray(_SYMS_100)[row_ids % 100],
+        'price': 50000 + row_ids % 1000,
+        'volume': 1000 + row_ids % 500
+    }
+    # tolist() converts to plain Python scalars, which the mocks serialize as-is
+    return tuple(
+        dict(zip(columns, row))
+        for row in zip(*(data[name].tolist() for name in columns))
+    )
+
+
+_DATASET_BUILDERS = {
+    'batch': partial(_batch_columns, 50000),
+    'mq': partial(_ticker_rows, 10000, ('timestamp', 'exchange', 'symbol', 'price')),
+    'db': partial(_ticker_rows, 10000, ('timestamp', 'exchange', 'symbol', 'price', 'volume'))
+}
+
+
+def _build_dataset(name: str) -> Any:
+    """Build one named dataset; runs in a worker process."""
+    return _DATASET_BUILDERS[name]()
+
+
+@pytest.fixture(scope="session")
+def perf_datasets() -> Dict[str, Any]:
+    """All large benchmark datasets, built in parallel worker processes."""
+    names = tuple(_DATASET_BUILDERS)
+    # CPU-bound allocation: processes sidestep the GIL and take their
+    # transient garbage with them when they exit
+    with ProcessPoolExecutor(max_workers=len(names)) as executor:
+        return dict(zip(names, executor.map(_build_dataset, names)))
+
+
+@pytest.fixture(scope="session")
+def batch_records_50k(perf_datasets) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only price/volume columns for 50k batch-processing records."""
+    prices, volumes = perf_datasets['batch']
+    prices.flags.writeable = False
+    volumes.flags.writeable = False
+    return prices, volumes
+
+
+@pytest.fixture(scope="session")
+def mq_messages_10k(perf_datasets) -> Tuple[Dict[str, Any], ...]:
+    """10k ticker messages for publish benchmarks."""
+    return perf_datasets['mq']
+
+
+@pytest.fixture(scope="session")
+def db_records_10k(perf_datasets) -> Tuple[Dict[str, Any], ...]:
+    """10k ticker records for insert benchmarks."""
+    return perf_datasets['db']
+
 
 class TestSystemPerformance:
     """Performance tests for the entire system."""
@@ -49,7 +131,7 @@ class TestSystemPerformance:
                 "flush_interval": 5.0
             },
             "performance": {
-                "max_concurrent_requests": 100,
+                "max_concurrent_requests": MAX_CONCURRENT_REQUESTS,
                 "connection_pool_size": 20,
                 "worker_threads": 4
             }
@@ -65,47 +147,32 @@ class TestSystemPerformance:
         }
     
     @pytest.mark.asyncio
-    async def test_system_startup_performance(self, performance_config, mock_components):
+    async def test_system_startup_performance(self, performance_config, mock_components, monkeypatch):
         """Test system startup time and resource usage."""
-        start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss
+        start_ns = time.perf_counter_ns()
+        start_memory = _PROC.memory_info().rss
         
         # Initialize all components
         config = AppConfig(**performance_config)
         
         cache_manager = CacheManager()
-        connection_pool = ConnectionPoolManager()
         batch_processor = BatchProcessorManager()
-        circuit_breaker_manager = CircuitBreakerManager()
-        retry_manager = RetryManagerRegistry()
-        health_monitor = HealthMonitor()
         
+        # The manager owns its circuit breakers, retry managers, health monitor and connection pool
         exchange_manager = ResilientExchangeManager()
-        exchange_manager.set_resilience_components(
-            circuit_breaker_manager=circuit_breaker_manager,
-            retry_manager=retry_manager,
-            health_monitor=health_monitor,
-            cache_manager=cache_manager,
-            connection_pool=connection_pool
-        )
         
-        # Mock exchange initialization
-        with patch('exchange_manager_v3.getattr') as mock_getattr:
-            mock_exchange_class = AsyncMock()
-            mock_exchange_instance = AsyncMock()
-            mock_exchange_instance.load_markets = AsyncMock()
-            mock_exchange_instance.markets = {'BTC/USDT': {}}
-            mock_exchange_class.return_value = mock_exchange_instance
-            mock_getattr.return_value = mock_exchange_class
-            
-            # Initialize exchanges
-            exchange_configs = [config.get_exchange_config(name) for name in config.exchanges]
-            await exchange_manager.initialize_exchanges(exchange_configs)
+        # Route exchange initialization to the prepared mocks
+        install_mock_ccxt(monkeypatch, exchange_manager_v3, {
+            name: mock_components['exchanges'][name] for name in config.exchanges
+        })
         
-        end_time = time.time()
-        end_memory = psutil.Process().memory_info().rss
+        # Initialize exchanges
+        exchange_configs = [ExchangeConfig(name=name) for name in config.exchanges]
+        await exchange_manager.initialize_exchanges(exchange_configs)
+        
+        startup_time = elapsed_seconds(start_ns)
+        end_memory = _PROC.memory_info().rss
         
-        startup_time = end_time - start_time
         memory_usage = (end_memory - start_memory) / 1024 / 1024  # MB
         
         # Performance assertions
@@ -115,10 +182,9 @@ class TestSystemPerformance:
         
         # Cleanup
         await exchange_manager.close_all()
-        await health_monitor.stop()
     
     @pytest.mark.asyncio
-    async def test_concurrent_data_collection_performance(self, mock_components):
+    async def test_concurrent_data_collection_performance(self, performance_config, mock_components):
         """Test performance under concurrent data collection load."""
         # Setup mock exchanges with realistic delays
         exchanges = {}
@@ -127,37 +193,43 @@ class TestSystemPerformance:
             exchange.set_delays(0.05, 0.02)  # Realistic network delays
             exchanges[name] = exchange
         
+        max_concurrent = performance_config['performance']['max_concurrent_requests']
+        
         # Test concurrent ticker fetching
         async def fetch_tickers_concurrent(exchange_name: str, iterations: int = 10):
             exchange = exchanges[exchange_name]
-            start_time = time.time()
-            
-            tasks = []
-            for _ in range(iterations):
-                tasks.append(exchange.fetch_tickers())
+            start_ns = time.perf_counter_ns()
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            end_time = time.time()
+            results = await gather_bounded(
+                (exchange.fetch_tickers() for _ in range(iterations)),
+                limit=max_concurrent,
+                return_exceptions=True
+            )
+            total_time = elapsed_seconds(start_ns)
             
             successful_results = [r for r in results if not isinstance(r, Exception)]
             return {
                 'exchange': exchange_name,
-                'total_time': end_time - start_time,
+                'total_time': total_time,
                 'successful_requests': len(successful_results),
                 'failed_requests': len(results) - len(successful_results),
-                'avg_response_time': (end_time - start_time) / len(results),
-                'throughput': len(results) / (end_time - start_time)
+                'avg_response_time': total_time / len(results),
+                'throughput': len(results) / total_time
             }
         
         # Run concurrent tests for all exchanges
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         tasks = [fetch_tickers_concurrent(name, 20) for name in exchanges.keys()]
         results = await asyncio.gather(*tasks)
-        total_time = time.time() - start_time
+        total_time = elapsed_seconds(start_ns)
         
         # Analyze results
-        total_requests = sum(r['successful_requests'] + r['failed_requests'] for r in results)
-        total_successful = sum(r['successful_requests'] for r in results)
+        per_exchange = np.array(
+            [(r['successful_requests'], r['failed_requests'], r['total_time']) for r in results],
+            dtype=[('successful', 'i8'), ('failed', 'i8'), ('total_time', 'f8')]
+        )
+        total_successful = int(per_exchange['successful'].sum())
+        total_requests = total_successful + int(per_exchange['failed'].sum())
         overall_throughput = total_requests / total_time
         success_rate = total_successful / total_requests
         
@@ -171,74 +243,69 @@ class TestSystemPerformance:
         print(f"  Success Rate: {success_rate:.2%}")
         print(f"  Overall Throughput: {overall_throughput:.2f} req/s")
         print(f"  Total Time: {total_time:.2f}s")
+        print(f"  Per-Exchange Time: {per_exchange['total_time'].mean():.2f}s "
+              f"± {per_exchange['total_time'].std():.2f}s")
     
-    @pytest.mark.asyncio
-    async def test_cache_performance(self):
+    async def test_cache_performance(self, benchmark):
         """Test cache system performance."""
         cache_manager = CacheManager()
+        await cache_manager.start()
         
-        # Test cache write performance
-        start_time = time.time()
-        for i in range(10000):
-            cache_manager.set('ticker', f'BTC/USDT_{i}', {'price': 50000 + i})
-        write_time = time.time() - start_time
-        
-        # Test cache read performance
-        start_time = time.time()
-        hits = 0
-        for i in range(10000):
-            result = cache_manager.get('ticker', f'BTC/USDT_{i}')
-            if result is not None:
-                hits += 1
-        read_time = time.time() - start_time
-        
-        # Performance assertions
-        assert write_time < 1.0, f"Cache write performance too slow: {write_time:.3f}s"
-        assert read_time < 0.5, f"Cache read performance too slow: {read_time:.3f}s"
-        assert hits == 10000, f"Cache hit rate incorrect: {hits}/10000"
-        
-        # Test cache statistics
-        stats = cache_manager.get_cache_stats()
-        assert stats['ticker']['hits'] >= 10000
-        assert stats['ticker']['misses'] >= 0
+        try:
+            # Fill the ticker cache to capacity so every read is a hit
+            capacity = cache_manager.get_cache('tickers').max_size
+            items = {symbol: {'price': 50000 + i} for i, symbol in enumerate(_SYMS_10K[:capacity])}
+            keys = tuple(items)
+            
+            def write_then_read():
+                cache_manager.set_many('tickers', items)
+                return cache_manager.get_many('tickers', keys)
+            
+            # Fixed rounds give a timing distribution instead of one wall-clock sample
+            rounds = 20
+            results = benchmark.pedantic(write_then_read, rounds=rounds, iterations=1, warmup_rounds=1)
+            hits = sum(1 for result in results if result is not None)
+            
+            # Performance assertions
+            median_time = benchmark.stats.stats.median
+            assert median_time < 1.5, f"Cache write+read performance too slow: {median_time:.3f}s"
+            assert hits == capacity, f"Cache hit rate incorrect: {hits}/{capacity}"
+            
+            # Test cache statistics: warmup plus measured rounds, all hits
+            stats = cache_manager.get_all_stats()['tickers']
+            assert stats.hits == capacity * (rounds + 1)
+            assert stats.misses == 0
+        finally:
+            await cache_manager.stop()
     
     @pytest.mark.asyncio
-    async def test_batch_processing_performance(self):
+    async def test_batch_processing_performance(self, batch_records_50k):
         """Test batch processing performance."""
         batch_processor = BatchProcessorManager()
-        
-        # Create large dataset
-        test_data = []
-        for i in range(50000):
-            test_data.append({
-                'timestamp': int(time.time() * 1000),
-                'exchange': 'binance',
-                'symbol': f'BTC/USDT_{i % 100}',
-                'price': 50000 + (i % 1000),
-                'volume': 1000 + (i % 500)
-            })
+        prices, volumes = batch_records_50k
         
         # Test batch processing performance
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Process in batches
+        # Process in batches: real per-batch work instead of a forced loop yield
         batch_size = 1000
         processed_count = 0
+        batch_vwaps = []
         
-        for i in range(0, len(test_data), batch_size):
-            batch = test_data[i:i + batch_size]
-            # Simulate batch processing
-            await asyncio.sleep(0.001)  # Minimal processing time
-            processed_count += len(batch)
+        for i in range(0, len(prices), batch_size):
+            batch_prices = prices[i:i + batch_size]
+            batch_volumes = volumes[i:i + batch_size]
+            batch_vwaps.append((batch_prices * batch_volumes).sum() / batch_volumes.sum())
+            processed_count += len(batch_prices)
         
-        end_time = time.time()
-        processing_time = end_time - start_time
+        processing_time = elapsed_seconds(start_ns)
         throughput = processed_count / processing_time
         
         # Performance assertions
         assert processing_time < 5.0, f"Batch processing too slow: {processing_time:.2f}s"
         assert throughput > 10000, f"Throughput too low: {throughput:.0f} records/s"
-        assert processed_count == len(test_data)
+        assert processed_count == len(prices)
+        assert len(batch_vwaps) == len(prices) // batch_size
         
         print(f"Batch Processing Results:")
         print(f"  Processed Records: {processed_count:,}")
@@ -246,7 +313,7 @@ class TestSystemPerformance:
         print(f"  Throughput: {throughput:,.0f} records/s")
     
     @pytest.mark.asyncio
-    async def test_message_queue_performance(self):
+    async def test_message_queue_performance(self, mq_messages_10k):
         """Test RabbitMQ client performance."""
         rabbitmq_client = MockAsyncRabbitMQClient()
         rabbitmq_client.set_delays(0.001, 0.0001)  # Very fast for performance testing
@@ -255,25 +322,14 @@ class TestSystemPerformance:
         await rabbitmq_client.declare_exchange('crypto_data', 'topic')
         
         # Test message publishing performance
-        messages = []
-        for i in range(10000):
-            messages.append({
-                'timestamp': int(time.time() * 1000),
-                'exchange': 'binance',
-                'symbol': f'BTC/USDT_{i % 100}',
-                'price': 50000 + (i % 1000)
-            })
+        messages = mq_messages_10k
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Publish messages in batches
-        batch_size = 100
-        for i in range(0, len(messages), batch_size):
-            batch = messages[i:i + batch_size]
-            await rabbitmq_client.publish_batch(batch, 'crypto_data', 'ticker.binance')
+        # Publish all messages in a single call
+        await rabbitmq_client.publish_all(messages, 'crypto_data', 'ticker.binance')
         
-        end_time = time.time()
-        publish_time = end_time - start_time
+        publish_time = elapsed_seconds(start_ns)
         throughput = len(messages) / publish_time
         
         # Performance assertions
@@ -286,7 +342,7 @@ class TestSystemPerformance:
         await rabbitmq_client.disconnect()
     
     @pytest.mark.asyncio
-    async def test_database_performance(self):
+    async def test_database_performance(self, db_records_10k):
         """Test database client performance."""
         db_client = MockDatabaseClient()
         db_client.set_delays(0.001, 0.0001)  # Very fast for performance testing
@@ -298,26 +354,17 @@ class TestSystemPerformance:
             'timestamp', 'exchange', 'symbol', 'price', 'volume'
         ])
         
-        # Generate test data
-        test_records = []
-        for i in range(10000):
-            test_records.append({
-                'timestamp': int(time.time() * 1000),
-                'exchange': 'binance',
-                'symbol': f'BTC/USDT_{i % 100}',
-                'price': 50000 + (i % 1000),
-                'volume': 1000 + (i % 500)
-            })
+        test_records = db_records_10k
         
         # Test batch insert performance
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         inserted_count = await db_client.insert_batch('performance_test', test_records)
-        insert_time = time.time() - start_time
+        insert_time = elapsed_seconds(start_ns)
         
         # Test select performance
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = await db_client.select_data('performance_test', limit=1000)
-        select_time = time.time() - start_time
+        select_time = elapsed_seconds(start_ns)
         
         # Performance assertions
         assert insert_time < 2.0, f"Database insert too slow: {insert_time:.2f}s"
@@ -345,40 +392,43 @@ class TestStressScenarios:
         
         # Test resilience components
         circuit_breaker_manager = CircuitBreakerManager()
-        retry_manager = RetryManagerRegistry()
+        retry_registry = RetryManagerRegistry()
         
         # Create circuit breakers and retry managers
+        failure_threshold = 5
         for name in exchanges.keys():
-            circuit_breaker_manager.create_circuit_breaker(f'exchange_{name}', {
-                'failure_threshold': 5,
-                'recovery_timeout': 10.0,
-                'success_threshold': 2
-            })
-            retry_manager.create_retry_manager(f'exchange_{name}', {
-                'max_attempts': 3,
-                'base_delay': 0.1,
-                'strategy': 'exponential'
-            })
+            circuit_breaker_manager.get_breaker(f'exchange_{name}', CircuitBreakerConfig(
+                failure_threshold=failure_threshold,
+                recovery_timeout=10.0,
+                success_threshold=2
+            ))
+            retry_registry.get_manager(f'exchange_{name}', RetryConfig(
+                max_attempts=3,
+                base_delay=0.1,
+                strategy=RetryStrategy.EXPONENTIAL,
+                # The mock raises plain Exception for every simulated outage
+                retryable_exceptions=(Exception,)
+            ))
         
         # Run stress test
         results = []
         for exchange_name, exchange in exchanges.items():
-            cb = circuit_breaker_manager.get_circuit_breaker(f'exchange_{exchange_name}')
-            rm = retry_manager.get_retry_manager(f'exchange_{exchange_name}')
+            cb = circuit_breaker_manager.get_breaker(f'exchange_{exchange_name}')
+            rm = retry_registry.get_manager(f'exchange_{exchange_name}')
             
-            successful_calls = 0
-            failed_calls = 0
+            fetch_through_breaker = partial(cb.call, exchange.fetch_tickers)
             
-            for _ in range(50):  # 50 attempts per exchange
-                try:
-                    async def fetch_with_resilience():
-                        return await rm.call(lambda: cb.call(exchange.fetch_tickers))
-                    
-                    result = await fetch_with_resilience()
-                    if result:
-                        successful_calls += 1
-                except Exception:
-                    failed_calls += 1
+            # 50 attempts per exchange, no more in flight than the breaker
+            # tolerates failures so it still trips on a sustained outage
+            outcomes = await gather_bounded(
+                (rm.execute_with_retry(fetch_through_breaker) for _ in range(50)),
+                limit=failure_threshold,
+                return_exceptions=True
+            )
+            successful_calls = sum(
+                1 for r in outcomes if r and not isinstance(r, Exception)
+            )
+            failed_calls = sum(isinstance(r, Exception) for r in outcomes)
             
             results.append({
                 'exchange': exchange_name,
@@ -403,17 +453,19 @@ class TestStressScenarios:
         
         # Get initial memory usage
         gc.collect()
-        initial_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+        initial_memory = _PROC.memory_info().rss / 1024 / 1024  # MB
         
         # Create components
         cache_manager = CacheManager()
+        await cache_manager.start()
         batch_processor = BatchProcessorManager()
+        keys = _SYMS_10K[:1000]
         
         # Simulate sustained load
         for iteration in range(100):
             # Generate data
-            for i in range(1000):
-                cache_manager.set('ticker', f'symbol_{i}', {
+            for i, key in enumerate(keys):
+                cache_manager.set('tickers', key, {
                     'price': 50000 + i,
                     'volume': 1000 + i,
                     'timestamp': time.time()
@@ -422,7 +474,7 @@ class TestStressScenarios:
             # Periodic memory check
             if iteration % 20 == 0:
                 gc.collect()
-                current_memory = psutil.Process().memory_info().rss / 1024 / 1024
+                current_memory = _PROC.memory_info().rss / 1024 / 1024
                 memory_growth = current_memory - initial_memory
                 
                 # Memory growth should be reasonable
@@ -430,7 +482,7 @@ class TestStressScenarios:
         
         # Final memory check
         gc.collect()
-        final_memory = psutil.Process().memory_info().rss / 1024 / 1024
+        final_memory = _PROC.memory_info().rss / 1024 / 1024
         total_growth = final_memory - initial_memory
         
         print(f"Memory Usage:")
@@ -440,93 +492,117 @@ class TestStressScenarios:
         
         # Memory growth should be reasonable for the workload
         assert total_growth < 200, f"Memory leak detected: {total_growth:.1f}MB growth"
+        
+        # The workload actually went through the cache
+        assert cache_manager.get_cache('tickers').get_stats().size == len(keys)
+        await cache_manager.stop()
     
     @pytest.mark.asyncio
     async def test_connection_pool_exhaustion(self):
         """Test behavior when connection pools are exhausted."""
-        connection_pool = ConnectionPoolManager()
-        
-        # Configure small pool for testing
         pool_size = 5
-        connections = []
-        
-        # Exhaust the pool
-        for i in range(pool_size):
-            conn = Mock()
-            connections.append(conn)
+        connection_pool = ConnectionPoolManager(max_connections=pool_size)
+        await connection_pool.start()
         
-        # Try to get one more connection (should handle gracefully)
         try:
-            extra_conn = Mock()  # Simulate pool exhaustion handling
-            # In real implementation, this would wait or fail gracefully
-            assert True  # Pool exhaustion handled
-        except Exception as e:
-            # Should be a controlled exception, not a crash
-            assert "pool" in str(e).lower() or "connection" in str(e).lower()
+            # The shared keep-alive session is capped at the configured size
+            connector = connection_pool.get_session().connector
+            assert connector.limit == pool_size
+            assert connector.limit_per_host == pool_size
+            
+            # Exhaust the per-exchange pool
+            pool = await connection_pool.get_pool('test_exchange', max_connections=pool_size)
+            async with contextlib.AsyncExitStack() as held:
+                for _ in range(pool_size):
+                    await held.enter_async_context(pool.get_session())
+                
+                # One more session has to wait for a slot instead of failing
+                with pytest.raises(asyncio.TimeoutError):
+                    async with asyncio.timeout(0.1):
+                        async with pool.get_session():
+                            pass
+            
+            # Released slots are usable again, on the manager's shared session
+            async with pool.get_session() as session:
+                assert session is connection_pool.get_session()
+        finally:
+            await connection_pool.stop()
 
 
 class TestBenchmarks:
     """Benchmark tests for performance comparison."""
     
-    @pytest.mark.asyncio
-    async def test_throughput_benchmarks(self):
+    # Runs once per loop; the uvloop case is skipped when uvloop is not installed
+    @pytest.mark.asyncio(loop_factories=["asyncio", "uvloop"])
+    async def test_throughput_benchmarks(self, monkeypatch):
         """Benchmark system throughput under various conditions."""
+        import gc
         
         benchmarks = {}
         
+        # The mocks' simulated per-minute rate limits would dominate the timings
+        # (htx alone adds up to 0.6s per call), so every benchmark runs without them
+        
         # Benchmark 1: Single exchange, no failures
-        exchange = MockExchangeFactory.create_exchange('binance')
+        exchange = MockExchangeFactory.create_exchange('binance', enableRateLimit=False)
         exchange.set_delays(0.01, 0.001)
         
-        start_time = time.time()
-        tasks = [exchange.fetch_tickers() for _ in range(100)]
-        await asyncio.gather(*tasks)
-        single_exchange_time = time.time() - start_time
+        # Collect up front so a full GC pass doesn't land in the short timed window
+        gc.collect()
+        start_ns = time.perf_counter_ns()
+        await gather_bounded(exchange.fetch_tickers() for _ in range(100))
+        single_exchange_time = elapsed_seconds(start_ns)
         
         benchmarks['single_exchange_throughput'] = 100 / single_exchange_time
         
         # Benchmark 2: Multiple exchanges, concurrent
-        exchanges = MockExchangeFactory.create_all_exchanges()
+        exchanges = MockExchangeFactory.create_all_exchanges(enableRateLimit=False)
         for ex in exchanges.values():
             ex.set_delays(0.01, 0.001)
         
-        start_time = time.time()
+        gc.collect()
+        start_ns = time.perf_counter_ns()
         tasks = []
         for exchange in exchanges.values():
             for _ in range(20):
                 tasks.append(exchange.fetch_tickers())
         
-        await asyncio.gather(*tasks)
-        multi_exchange_time = time.time() - start_time
+        await gather_bounded(tasks)
+        multi_exchange_time = elapsed_seconds(start_ns)
         
         benchmarks['multi_exchange_throughput'] = len(tasks) / multi_exchange_time
         
-        # Benchmark 3: With resilience components
-        circuit_breaker_manager = CircuitBreakerManager()
-        retry_manager = RetryManagerRegistry()
-        
-        cb = circuit_breaker_manager.create_circuit_breaker('test', {
-            'failure_threshold': 10,
-            'recovery_timeout': 60.0
-        })
-        rm = retry_manager.create_retry_manager('test', {
-            'max_attempts': 2,
-            'base_delay': 0.001,
-            'strategy': 'fixed'
-        })
-        
-        start_time = time.time()
-        tasks = []
-        for _ in range(100):
-            tasks.append(rm.call(lambda: cb.call(exchange.fetch_tickers)))
+        # Benchmark 3: Through ResilientExchangeManager (circuit breaker + retry)
+        exchange = MockExchangeFactory.create_exchange('binance', enableRateLimit=False)
+        exchange.set_delays(0.01, 0.001)
+        install_mock_ccxt(monkeypatch, exchange_manager_v3, {'binance': exchange})
         
-        await asyncio.gather(*tasks)
-        resilient_time = time.time() - start_time
+        exchange_manager = ResilientExchangeManager()
+        await exchange_manager.initialize_exchanges([ExchangeConfig(
+            name='binance',
+            circuit_breaker_config=CircuitBreakerConfig(failure_threshold=10, recovery_timeout=60.0),
+            retry_config=RetryConfig(max_attempts=2, base_delay=0.001, strategy=RetryStrategy.FIXED)
+        )])
+        resilient_exchange = exchange_manager.get_exchange('binance')
         
+        try:
+            # Warm-up call so breaker/retry bookkeeping setup is not timed
+            await resilient_exchange.fetch_tickers()
+            
+            gc.collect()
+            start_ns = time.perf_counter_ns()
+            results = await gather_bounded(resilient_exchange.fetch_tickers() for _ in range(100))
+            resilient_time = elapsed_seconds(start_ns)
+        finally:
+            await exchange_manager.close_all()
+        
+        # fetch_tickers returns None instead of raising when the call fails
+        assert all(result is not None for result in results)
         benchmarks['resilient_throughput'] = 100 / resilient_time
         
         # Print benchmark results
-        print("\nBenchmark Results:")
+        print(f"\nBenchmark Results ({type(asyncio.get_running_loop()).__module__}, "
+              f"max {MAX_CONCURRENT_REQUESTS} concurrent requests):")
         for name, throughput in benchmarks.items():
             print(f"  {name}: {throughput:.1f} req/s")
         
@@ -1,14 +1,22 @@
-import unittest
-from unittest.mock import patch, MagicMock
+import pytest
 import sys
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 # Добавляем корневую директорию проекта в путь
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Создаем изолированные копии функций для тестирования
-def safe_get_nested_data(data: Dict[str, Any], path: List[str], default: Any = None) -> Any:
+_POSSIBLE_PATHS = (
+    ('data', 'items', 0, 'data'),
+    ('data', 'items', 0),
+    ('data', 'items'),
+    ('data',),
+    (),
+)
+
+
+def safe_get_nested_data(data: Dict[str, Any], path: Sequence[Any], default: Any = None) -> Any:
     """
     Безопасно извлекает вложенные данные из словаря по указанному пути.
     """
@@ -36,15 +44,7 @@ def extract_json_data_safely(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Безопасно извлекает данные из JSON структуры.
     """
-    possible_paths = [
-        ['data', 'items', 0, 'data'],
-        ['data', 'items', 0],
-        ['data', 'items'],
-        ['data'],
-        [],
-    ]
-    
-    for path in possible_paths:
+    for path in _POSSIBLE_PATHS:
         result = safe_get_nested_data(data, path)
         if result is not None:
             return result
@@ -63,91 +63,71 @@ def transform_futures_data(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     for exchange_name, exchange_value in data.items():
         if not isinstance(exchange_value, dict):
             continue
-            
-        for future_name, future_value in exchange_value.items():
-            if not isinstance(future_value, dict):
-                continue
-                
-            record = future_value.copy()
-            record["exchange"] = exchange_name
-            record["symbol"] = future_name
+        
+        records = [
+            dict(future_value, exchange=exchange_name, symbol=future_name)
+            for future_name, future_value in exchange_value.items()
+            if isinstance(future_value, dict)
+        ]
+        for record in records:
             record.pop("info", None)
-            
-            result.append(record)
+        
+        result.extend(records)
     
     return result
 
 
-class TestSafeGetNestedData(unittest.TestCase):
+# Общие данные для TestSafeGetNestedData; тесты только читают их,
+# тест, которому нужно изменить данные, берет свою copy.deepcopy
+_TEST_DATA = {
+    "data": {
+        "items": [
+            {"data": {"exchange1": {"BTC/USD": {"price": 50000}}}},
+            {"data": {"exchange2": {"ETH/USD": {"price": 3000}}}}
+        ],
+        "metadata": {"count": 2}
+    },
+    "status": "success"
+}
+
+
+class TestSafeGetNestedData:
     """Тесты для функции safe_get_nested_data"""
     
-    def setUp(self):
-        self.test_data = {
-            "data": {
-                "items": [
-                    {"data": {"exchange1": {"BTC/USD": {"price": 50000}}}},
-                    {"data": {"exchange2": {"ETH/USD": {"price": 3000}}}}
-                ],
-                "metadata": {"count": 2}
-            },
-            "status": "success"
-        }
-    
-    def test_successful_path_extraction(self):
-        """Тест успешного извлечения данных по пути"""
-        result = safe_get_nested_data(self.test_data, ['data', 'items', 0, 'data'])
-        expected = {"exchange1": {"BTC/USD": {"price": 50000}}}
-        self.assertEqual(result, expected)
-    
-    def test_missing_key_returns_default(self):
-        """Тест возврата значения по умолчанию при отсутствующем ключе"""
-        result = safe_get_nested_data(self.test_data, ['data', 'missing_key'], default="not_found")
-        self.assertEqual(result, "not_found")
-    
-    def test_index_out_of_range_returns_default(self):
-        """Тест возврата значения по умолчанию при индексе вне диапазона"""
-        result = safe_get_nested_data(self.test_data, ['data', 'items', 10], default="not_found")
-        self.assertEqual(result, "not_found")
+    @pytest.mark.parametrize("path,default,expected", [
+        # Успешное извлечение данных по пути
+        (['data', 'items', 0, 'data'], None, {"exchange1": {"BTC/USD": {"price": 50000}}}),
+        # Значение по умолчанию при отсутствующем ключе
+        (['data', 'missing_key'], "not_found", "not_found"),
+        # Значение по умолчанию при индексе вне диапазона
+        (['data', 'items', 10], "not_found", "not_found"),
+    ], ids=["successful_path", "missing_key", "index_out_of_range"])
+    def test_path_extraction(self, path, default, expected):
+        """Тест извлечения данных по пути"""
+        assert safe_get_nested_data(_TEST_DATA, path, default=default) == expected
     
     def test_empty_path_returns_original_data(self):
         """Тест возврата исходных данных при пустом пути"""
-        result = safe_get_nested_data(self.test_data, [])
-        self.assertEqual(result, self.test_data)
+        assert safe_get_nested_data(_TEST_DATA, []) == _TEST_DATA
     
     def test_none_data_returns_default(self):
         """Тест возврата значения по умолчанию при None данных"""
-        result = safe_get_nested_data(None, ['data'], default="default")
-        self.assertEqual(result, "default")
+        assert safe_get_nested_data(None, ['data'], default="default") == "default"
 
 
-class TestExtractJsonDataSafely(unittest.TestCase):
+class TestExtractJsonDataSafely:
     """Тесты для функции extract_json_data_safely"""
     
-    def test_extract_with_standard_path(self):
-        """Тест извлечения данных по стандартному пути"""
-        test_data = {
-            "data": {
-                "items": [
-                    {"data": {"exchange1": {"BTC/USD": {"price": 50000}}}}
-                ]
-            }
-        }
-        
-        result = extract_json_data_safely(test_data)
-        expected = {"exchange1": {"BTC/USD": {"price": 50000}}}
-        self.assertEqual(result, expected)
-    
-    def test_extract_with_alternative_path(self):
-        """Тест извлечения данных по альтернативному пути"""
-        test_data = {
-            "data": {
-                "items": [{"exchange1": {"BTC/USD": {"price": 50000}}}]
-            }
-        }
-        
-        result = extract_json_data_safely(test_data)
+    @pytest.mark.parametrize("test_data", [
+        # Стандартный путь
+        {"data": {"items": [{"data": {"exchange1": {"BTC/USD": {"price": 50000}}}}]}},
+        # Альтернативный путь
+        {"data": {"items": [{"exchange1": {"BTC/USD": {"price": 50000}}}]}},
+    ], ids=["standard_path", "alternative_path"])
+    def test_extract_known_paths(self, test_data):
+        """Тест извлечения данных по известным путям"""
         expected = {"exchange1": {"BTC/USD": {"price": 50000}}}
-        self.assertEqual(result, expected)
+        assert extract_json_data_safely(test_data) == expected
     
     def test_extract_returns_none_when_no_data_found(self):
         """Тест возврата корневых данных когда специфическая структура не найдена"""
@@ -155,10 +135,10 @@ class TestExtractJsonDataSafely(unittest.TestCase):
         
         result = extract_json_data_safely(test_data)
         # Функция возвращает корневые данные как fallback
-        self.assertEqual(result, test_data)
+        assert result == test_data
 
 
-class TestTransformFuturesData(unittest.TestCase):
+class TestTransformFuturesData:
     """Тесты для функции transform_futures_data"""
     
     def test_successful_transformation(self):
@@ -176,24 +156,24 @@ class TestTransformFuturesData(unittest.TestCase):
         result = transform_futures_data(test_data)
         
         # Проверяем количество записей
-        self.assertEqual(len(result), 3)
+        assert len(result) == 3
         
         # Проверяем структуру первой записи
         first_record = result[0]
-        self.assertIn("exchange", first_record)
-        self.assertIn("symbol", first_record)
-        self.assertIn("price", first_record)
-        self.assertIn("volume", first_record)
-        self.assertNotIn("info", first_record)  # info должно быть удалено
+        assert "exchange" in first_record
+        assert "symbol" in first_record
+        assert "price" in first_record
+        assert "volume" in first_record
+        assert "info" not in first_record  # info должно быть удалено
         
         # Проверяем правильность данных
         binance_btc = next(r for r in result if r["exchange"] == "binance" and r["symbol"] == "BTC/USD")
-        self.assertEqual(binance_btc["price"], 50000)
-        self.assertEqual(binance_btc["volume"], 1000)
+        assert binance_btc["price"] == 50000
+        assert binance_btc["volume"] == 1000
     
     def test_invalid_input_raises_error(self):
         """Тест выброса ошибки при неправильном входном формате"""
-        with self.assertRaises(ValueError):
+        with pytest.raises(ValueError):
             transform_futures_data("not_a_dict")
     
     def test_skips_invalid_exchange_data(self):
@@ -211,13 +191,12 @@ class TestTransformFuturesData(unittest.TestCase):
         result = transform_futures_data(test_data)
         
         # Должно быть только 2 записи (пропускаем invalid_exchange)
-        self.assertEqual(len(result), 2)
+        assert len(result) == 2
     
     def test_empty_data_returns_empty_list(self):
         """Тест возврата пустого списка для пустых данных"""
-        result = transform_futures_data({})
-        self.assertEqual(result, [])
+        assert transform_futures_data({}) == []
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__, "-v"])
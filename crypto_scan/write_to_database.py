@@ -1,9 +1,12 @@
-import asyncio
-import datetime
 from packages import processor_template
 from packages.app_template import AppTemplate, logger
 from packages.clickhouse_dispatcher import ClickhouseDispatcher
+from packages.event_loop import run
+from clickhouse_connect.driver import httputil
 import json
+import operator
+
+import numpy as np
 
 MAX_CONCURRENT_TASKS = 500
 
@@ -13,6 +16,12 @@ MAIN_LOOP_DELAY_TIME = 5
 # до момента когда исходящие сообщения перестанут отправляться.
 MAX_INCOMING_QUEUE_DELAY = 120
 
+# размер собственного пула HTTP соединений к Clickhouse
+CLICKHOUSE_POOL_SIZE = 16
+
+# с какого размера пачки фильтруем записи через numpy
+VECTORIZE_MIN_RECORDS = 64
+
 
 def load_data_from_json(filename):
     with open(filename, 'r') as f:
@@ -26,47 +35,54 @@ def save_data_to_json(data, filename):
 
 
 
-def apply_filter(data, filter):
-    result = True
-    filter_type = filter["type"]
-    filter_value = 0.0
-    data_value = 0.0
-    if "minimal_profit" == filter_type:
-        filter_value = float(filter["value"])
-        data_value = float(data["equilibrium_profit"])
-        result = (data_value >= filter_value)
-
-    if "minimal_percent" == filter_type:
-        filter_value = float(filter["value"])
-        data_value = float(data["equilibrium_profit_rate"]) * 100
-        result = (data_value >= filter_value)
-
-    if "maximal_percent" == filter_type:
-        filter_value = float(filter["value"])
-        data_value = float(data["equilibrium_profit_rate"]) * 100
-        result = (data_value < filter_value)
-
-    if result:
-        logger.debug(f"Filter {filter_type} requirements {data_value} >= {filter_value} are satisfied ")
-    else:
-        logger.debug(f"Filter {filter_type} requirements {data_value} >= {filter_value} are NOT satisfied ")
-
-    return result
-
-
-def process_data(data, filters):
-    result = []
-    if not filters:
+# тип фильтра -> (поле profitability, множитель, сравнение с порогом)
+FILTER_RULES = {
+    "minimal_profit": ("equilibrium_profit", 1, operator.ge),
+    "minimal_percent": ("equilibrium_profit_rate", 100, operator.ge),
+    "maximal_percent": ("equilibrium_profit_rate", 100, operator.lt),
+}
+
+
+def compile_filters(filters):
+    # разбираем фильтры один раз: тип и порог не меняются между итерациями
+    plan = []
+    for filter in filters or []:
+        rule = FILTER_RULES.get(filter["type"])
+        if rule is None:
+            # неизвестный тип фильтра ничего не отсекает
+            continue
+        field, scale, compare = rule
+        plan.append((field, scale, compare, float(filter["value"])))
+    return plan
+
+
+def filter_vectorized(data, plan):
+    # одна колонка на поле, маска по всем фильтрам сразу
+    columns = {}
+    mask = np.ones(len(data), dtype=bool)
+    for field, scale, compare, value in plan:
+        column = columns.get(field)
+        if column is None:
+            column = np.fromiter((float(item["profitability"][field]) for item in data),
+                                 dtype=np.float64, count=len(data))
+            columns[field] = column
+        mask &= compare(column * scale, value)
+    return [data[i] for i in np.flatnonzero(mask)]
+
+
+def process_data(data, plan):
+    if not plan:
         return data
-    for item in data:
-        profitability_data = item["profitability"]
-        comply = True
-        for filter in filters:
-            comply = comply and apply_filter(profitability_data, filter)
-        # add only records that comply with filters requirements
-        if comply:
-            result.append(item)
-
+    # add only records that comply with filters requirements
+    if len(data) >= VECTORIZE_MIN_RECORDS:
+        result = filter_vectorized(data, plan)
+    else:
+        result = [
+            item for item in data
+            if all(compare(float(item["profitability"][field]) * scale, value)
+                   for field, scale, compare, value in plan)
+        ]
+    logger.debug("%s of %s records satisfy filters", len(result), len(data))
     return result
 
 
@@ -82,7 +98,10 @@ async def main():
                                          at.settings["in_exchange"])
     CONNECTION_STRING = (f'http://{at.settings["clickhouse_user"]}:{at.settings["clickhouse_password"]}@'
                          f'{at.settings["clickhouse_host"]}:{at.settings["clickhouse_port"]}/')
-    dd = ClickhouseDispatcher(connection_string=CONNECTION_STRING)
+    # один хост - один пул; соединения переиспользуются между вставками через keep-alive
+    pool_mgr = httputil.get_pool_manager(num_pools=1, maxsize=CLICKHOUSE_POOL_SIZE)
+    dd = ClickhouseDispatcher(connection_string=CONNECTION_STRING, pool_mgr=pool_mgr)
+    filters_plan = compile_filters(at.settings["filters"])
 
     while True:
 
@@ -93,7 +112,7 @@ async def main():
 
         enriched_data = []
         if received_data:
-            enriched_data = process_data(received_data, at.settings["filters"])
+            enriched_data = process_data(received_data, filters_plan)
             # save_data_to_json(enreached_data, "../data/telegram_informant.json")
 
         # устанавливаем данные на отправку
@@ -101,17 +120,16 @@ async def main():
             await dd.set_data(enriched_data)
 
         # если долго не было входящих данных, перестаем отправлять выходные данные
-        last_update_time = await dr.get_last_update_time()
-        delta_time = datetime.datetime.now() - last_update_time
-        logger.debug(f"Delta time {delta_time}")
+        delta_time = dr.seconds_since_update()
+        logger.debug("Delta time %s", delta_time)
 
-        if delta_time > datetime.timedelta(seconds=MAX_INCOMING_QUEUE_DELAY):
+        if delta_time > MAX_INCOMING_QUEUE_DELAY:
             logger.info(f"Delta time is too big, disable sending data to output exchange")
             await dd.set_data(None)
 
-        # Ждем некоторое время перед следующей итерацией
-        await asyncio.sleep(MAIN_LOOP_DELAY_TIME)  # Можете установить другое значение времени ожидания
+        # Ждем новых данных, но не дольше MAIN_LOOP_DELAY_TIME, чтобы проверять задержку входящих данных
+        await dr.wait_for_update(MAIN_LOOP_DELAY_TIME)
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run(main())
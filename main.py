@@ -1,7 +1,11 @@
 import asyncio
 import logging
+import ssl
+import aiohttp
+import certifi
 from typing import List
 from utils.config_loader import load_config, load_api_keys
+from utils.event_loop import run
 from utils.logger import setup_logging
 from utils.statistics import Statistics
 from utils.shared_state import SharedState
@@ -18,7 +22,9 @@ async def run_exchange_collector(
     interval: int,
     retry_attempts: int,
     retry_delays: List[int],
-    stats: Statistics
+    max_concurrent_requests: int,
+    stats: Statistics,
+    session: aiohttp.ClientSession
 ):
     """Запускает сборщик для одной биржи"""
     logger = logging.getLogger(exchange_name)
@@ -26,29 +32,50 @@ async def run_exchange_collector(
         exchange_name, 
         api_keys.get(exchange_name, {}),
         retry_attempts,
-        retry_delays
+        retry_delays,
+        session=session
     )
     
+    # Ограничиваем число одновременных запросов к бирже
+    semaphore = asyncio.Semaphore(max_concurrent_requests)
+    
+    async def collect_and_publish(symbol: str):
+        async with semaphore:
+            data = await collector.collect_futures_data(symbol)
+        if data:
+            # Публикуем сразу, не дожидаясь остальных символов тика;
+            # подтверждения учитываются в статистике по мере прихода
+            await publisher.publish_nowait(data, stats.record_publish_result)
+            # Успех сбора учитываем после передачи в publish_nowait, чтобы его ошибка
+            # не дала для одного символа и успех, и ошибку
+            stats.record_success(exchange_name)
+        else:
+            stats.record_error(exchange_name)
+    
     logger.info(f"Starting collector for {exchange_name}")
     
+    loop = asyncio.get_running_loop()
+    
     try:
         while True:
+            tick_started = loop.time()
+            
             # Получаем текущий список символов из shared state
             current_symbols = await shared_state.get_symbols()
             
-            for symbol in current_symbols:
-                data = await collector.collect_futures_data(symbol)
-                if data:
-                    stats.record_success(exchange_name)
-                    success = await publisher.publish(data)
-                    if success:
-                        stats.record_published()
-                    else:
-                        stats.record_publish_failed()
-                else:
+            # Собираем данные по всем символам параллельно, каждый символ публикуется по готовности
+            results = await asyncio.gather(
+                *(collect_and_publish(symbol) for symbol in current_symbols),
+                return_exceptions=True
+            )
+            
+            for symbol, result in zip(current_symbols, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to collect {symbol}: {result}")
                     stats.record_error(exchange_name)
             
-            await asyncio.sleep(interval)
+            # Интервал считаем от начала тика, чтобы время сбора не сдвигало расписание
+            await asyncio.sleep(max(0.0, interval - (loop.time() - tick_started)))
     except asyncio.CancelledError:
         logger.info(f"Collector for {exchange_name} cancelled")
     except Exception as e:
@@ -95,7 +122,8 @@ async def main():
         port=config.rabbitmq.port,
         user=config.rabbitmq.user,
         password=config.rabbitmq.password,
-        exchange_name=config.rabbitmq.exchange
+        exchange_name=config.rabbitmq.exchange,
+        max_inflight=config.rabbitmq.publish_max_inflight
     )
     await publisher.connect()
     
@@ -119,49 +147,57 @@ async def main():
     await control_listener.connect()
     await control_listener.start()
     
-    # Создаем задачи для каждой биржи
-    tasks = []
-    for exchange in config.exchanges:
-        task = asyncio.create_task(
-            run_exchange_collector(
-                exchange,
-                shared_state,
-                api_keys,
-                publisher,
-                config.collection.interval_seconds,
-                config.collection.retry_attempts,
-                config.collection.retry_delays,
-                stats
-            )
-        )
-        tasks.append(task)
-    
-    # Добавляем задачу для вывода статистики
-    stats_task = asyncio.create_task(print_statistics_periodically(stats))
-    tasks.append(stats_task)
+    # Общий пул HTTP соединений для всех бирж: keep-alive и лимит сокетов на хост
+    # SSL контекст с certifi и прокси из окружения - как у собственной сессии ccxt
+    connector = aiohttp.TCPConnector(
+        limit=config.collection.max_connections,
+        limit_per_host=config.collection.max_connections_per_host,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        ssl=ssl.create_default_context(cafile=certifi.where())
+    )
+    session = aiohttp.ClientSession(connector=connector, trust_env=True)
     
     try:
-        # Ждем выполнения всех задач
-        await asyncio.gather(*tasks)
-    except KeyboardInterrupt:
-        logger.info("Shutting down...")
-    except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        # TaskGroup отменяет все задачи при выходе и дожидается их завершения
+        async with asyncio.TaskGroup() as tg:
+            # Создаем задачи для каждой биржи
+            for exchange in config.exchanges:
+                tg.create_task(
+                    run_exchange_collector(
+                        exchange,
+                        shared_state,
+                        api_keys,
+                        publisher,
+                        config.collection.interval_seconds,
+                        config.collection.retry_attempts,
+                        config.collection.retry_delays,
+                        config.collection.max_concurrent_requests,
+                        stats,
+                        session
+                    )
+                )
+            
+            # Добавляем задачу для вывода статистики
+            tg.create_task(print_statistics_periodically(stats))
+    except* Exception as eg:
+        for e in eg.exceptions:
+            logger.error(f"Unexpected error: {e}")
     finally:
-        # Отменяем все задачи
-        logger.info("Cancelling all tasks...")
-        for task in tasks:
-            if not task.done():
-                task.cancel()
-        
-        # Ждем завершения всех задач
-        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Shutting down...")
         
-        # Закрываем соединения с RabbitMQ
-        await publisher.close()
-        await control_listener.close()
+        # Сборщики остановлены: закрываем HTTP сессию и соединения с RabbitMQ параллельно
+        results = await asyncio.gather(
+            session.close(),
+            publisher.close(),
+            control_listener.close(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during shutdown: {result}")
         logger.info("Shutdown complete")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -10,12 +10,16 @@ class RabbitMQConfig(BaseModel):
     exchange: str
     control_queue: str = "futures_collector_control"
     response_exchange: str = "futures_collector_responses"
+    publish_max_inflight: int = 256
 
 
 class CollectionConfig(BaseModel):
     interval_seconds: int
     retry_attempts: int
     retry_delays: List[int]
+    max_concurrent_requests: int = 10
+    max_connections: int = 200
+    max_connections_per_host: int = 10
 
 
 class LoggingConfig(BaseModel):
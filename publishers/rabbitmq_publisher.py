@@ -1,17 +1,28 @@
+import asyncio
 import logging
-from typing import Optional
+from functools import partial
+from typing import Callable, Dict, Optional, Set, Tuple
 import aio_pika
 from aio_pika import Connection, Channel, Exchange
 from models.futures_data import FuturesData
 
+# Сколько секунд при закрытии ждать подтверждений неотправленных сообщений
+DRAIN_TIMEOUT = 10.0
+
 
 class RabbitMQPublisher:
-    def __init__(self, host: str, port: int, user: str, password: str, exchange_name: str):
+    def __init__(self, host: str, port: int, user: str, password: str, exchange_name: str,
+                 max_inflight: int = 256):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.exchange_name = exchange_name
+        # Публикации, ожидающие подтверждения брокера, и лимит на их число
+        self._inflight: Set[asyncio.Task] = set()
+        self._inflight_slots = asyncio.Semaphore(max_inflight)
+        # Кэш routing key по (exchange, symbol): набор символов повторяется каждый тик
+        self._routing_keys: Dict[Tuple[str, str], str] = {}
         self.connection: Optional[Connection] = None
         self.channel: Optional[Channel] = None
         self.exchange: Optional[Exchange] = None
@@ -40,34 +51,68 @@ class RabbitMQPublisher:
             self.logger.error(f"Failed to connect to RabbitMQ: {e}")
             raise
     
-    async def publish(self, data: FuturesData) -> bool:
-        """Отправляет данные в RabbitMQ"""
-        try:
+    def _routing_key(self, exchange: str, symbol: str) -> str:
+        routing_key = self._routing_keys.get((exchange, symbol))
+        if routing_key is None:
             # Формируем routing key: futures.binance.BTCUSDT
-            symbol_normalized = data.symbol.replace('/', '').replace(':', '')
-            routing_key = f"futures.{data.exchange}.{symbol_normalized}"
-            
-            # Сериализуем данные в JSON
-            message_body = data.model_dump_json()
-            
-            # Отправляем сообщение
-            await self.exchange.publish(
-                aio_pika.Message(
-                    body=message_body.encode('utf-8'),
-                    content_type='application/json'
-                ),
-                routing_key=routing_key
-            )
-            
-            self.logger.info(f"Published to {routing_key}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to publish message: {e}")
-            return False
+            symbol_normalized = symbol.replace('/', '').replace(':', '')
+            routing_key = f"futures.{exchange}.{symbol_normalized}"
+            self._routing_keys[(exchange, symbol)] = routing_key
+        return routing_key
+    
+    def _build_message(self, data: FuturesData) -> Tuple[aio_pika.Message, str]:
+        routing_key = self._routing_key(data.exchange, data.symbol)
+        
+        # Сериализуем данные в JSON
+        message_body = data.model_dump_json()
+        
+        message = aio_pika.Message(
+            body=message_body.encode('utf-8'),
+            content_type='application/json'
+        )
+        return message, routing_key
+    
+    async def publish_nowait(self, data: FuturesData, on_result: Callable[[bool], None]):
+        """Ставит данные на публикацию, не дожидаясь подтверждения брокера.
+        Результат публикации передается в on_result"""
+        # Все, что может упасть, делаем до захвата слота, иначе слот не освободится
+        if self.exchange is None:
+            raise RuntimeError("RabbitMQ publisher is not connected")
+        message, routing_key = self._build_message(data)
+        # Ждем только если в полете уже max_inflight сообщений
+        await self._inflight_slots.acquire()
+        task = asyncio.create_task(self.exchange.publish(message, routing_key=routing_key))
+        self._inflight.add(task)
+        task.add_done_callback(partial(self._on_publish_done, routing_key, on_result))
+    
+    def _on_publish_done(self, routing_key: str, on_result: Callable[[bool], None], task: asyncio.Task):
+        self._inflight.discard(task)
+        self._inflight_slots.release()
+        if task.cancelled():
+            self.logger.error(f"Publish to {routing_key} cancelled")
+            on_result(False)
+        elif task.exception() is not None:
+            self.logger.error(f"Failed to publish message to {routing_key}: {task.exception()}")
+            on_result(False)
+        else:
+            on_result(True)
+    
+    async def drain(self, timeout: float = DRAIN_TIMEOUT):
+        """Ждет подтверждения отправленных сообщений не дольше timeout секунд,
+        неподтвержденные публикации отменяются"""
+        if not self._inflight:
+            return
+        # Пока брокер недоступен, connect_robust держит публикации в ожидании переподключения
+        _, pending = await asyncio.wait(set(self._inflight), timeout=timeout)
+        if pending:
+            self.logger.warning(f"Cancelling {len(pending)} unconfirmed publishes after {timeout}s")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def close(self):
         """Закрывает соединение с RabbitMQ"""
+        await self.drain()
         if self.connection:
             await self.connection.close()
             self.logger.info("RabbitMQ connection closed")
@@ -11,6 +11,14 @@ import os
 import aio_pika
 from aio_pika import Message
 
+# Корень проекта в sys.path: скрипт запускается как python scripts/control_client.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.event_loop import run
+from utils.json_codec import dumps, loads
+
+# Псевдо-очередь RabbitMQ direct reply-to: ответы приходят прямо в канал клиента
+REPLY_TO_QUEUE = "amq.rabbitmq.reply-to"
+
 
 def load_config():
     """Загрузить конфигурацию из config.json"""
@@ -39,73 +47,98 @@ class ControlClient:
             self.password = password
             self.control_queue = "futures_collector_control"
             self.response_exchange = "futures_collector_responses"
+        
+        # Соединение и канал создаются лениво и переиспользуются между командами
+        self._connection = None
+        self._channel = None
+        self._lock = asyncio.Lock()
+        # Ожидающие ответа команды: correlation_id -> Future
+        self._pending = {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _ensure_channel(self):
+        """Открыть соединение, канал и очередь ответов при первом использовании"""
+        async with self._lock:
+            if self._channel is not None:
+                return
+            
+            # Подключаемся к RabbitMQ
+            self._connection = await aio_pika.connect_robust(
+                host=self.host,
+                port=self.port,
+                login=self.user,
+                password=self.password
+            )
+            # Подтверждения брокера не нужны: доставку подтверждает ответ с correlation_id
+            self._channel = await self._connection.channel(publisher_confirms=False)
+            
+            # Ответы через direct reply-to: без объявления и привязки своей очереди.
+            # Псевдо-очередь не объявляется и читается только в режиме no_ack
+            reply_queue = await self._channel.get_queue(REPLY_TO_QUEUE, ensure=False)
+            await reply_queue.consume(self._on_response, no_ack=True)
+    
+    async def _on_response(self, message: aio_pika.IncomingMessage):
+        response = loads(message.body)
+        response_future = self._pending.get(response.get("correlation_id"))
+        if response_future is not None and not response_future.done():
+            response_future.set_result(response)
     
     async def send_command(self, command_data: dict, timeout: float = 5.0):
         """Отправить команду и дождаться ответа"""
+        await self._ensure_channel()
         
         # Генерируем correlation_id
         correlation_id = str(uuid.uuid4())
         command_data["correlation_id"] = correlation_id
         command_data["timestamp"] = int(time.time())
         
-        # Подключаемся к RabbitMQ
-        connection = await aio_pika.connect_robust(
-            host=self.host,
-            port=self.port,
-            login=self.user,
-            password=self.password
-        )
-        
-        channel = await connection.channel()
-        
-        # Создаем временную очередь для ответов
-        response_queue = await channel.declare_queue(
-            f"response_{correlation_id}",
-            exclusive=True,
-            auto_delete=True
-        )
-        
-        # Привязываем к response exchange
-        await response_queue.bind(
-            self.response_exchange,
-            routing_key=f"control.response.{command_data['command']}"
-        )
-        
         # Future для ответа
-        response_future = asyncio.Future()
-        
-        async def on_response(message: aio_pika.IncomingMessage):
-            async with message.process():
-                response = json.loads(message.body.decode())
-                if response.get("correlation_id") == correlation_id:
-                    response_future.set_result(response)
-        
-        await response_queue.consume(on_response)
-        
-        # Отправляем команду
-        await channel.default_exchange.publish(
-            Message(
-                body=json.dumps(command_data).encode('utf-8'),
-                content_type='application/json',
-                correlation_id=correlation_id
-            ),
-            routing_key=self.control_queue
-        )
-        
-        print(f"⏳ Sending command: {command_data['command']}...")
+        response_future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = response_future
         
         try:
+            # Отправляем команду
+            await self._channel.default_exchange.publish(
+                Message(
+                    body=dumps(command_data),
+                    content_type='application/json',
+                    correlation_id=correlation_id,
+                    reply_to=REPLY_TO_QUEUE
+                ),
+                routing_key=self.control_queue
+            )
+            
+            print(f"⏳ Sending command: {command_data['command']}...")
+            
             # Ждем ответ
-            response = await asyncio.wait_for(response_future, timeout=timeout)
-            await connection.close()
-            return response
+            return await asyncio.wait_for(response_future, timeout=timeout)
         except asyncio.TimeoutError:
-            await connection.close()
             return {
                 "success": False,
                 "error": "timeout",
                 "message": f"No response received within {timeout} seconds"
             }
+        finally:
+            self._pending.pop(correlation_id, None)
+    
+    async def send_many(self, commands: list, timeout: float = 5.0) -> list:
+        """Отправить несколько независимых команд параллельно, ответы в порядке команд"""
+        await self._ensure_channel()
+        return await asyncio.gather(
+            *(self.send_command(command_data, timeout) for command_data in commands)
+        )
+    
+    async def close(self):
+        """Закрыть соединение с RabbitMQ"""
+        if self._connection is not None:
+            await self._connection.close()
+        self._connection = None
+        self._channel = None
 
 
 def print_response(response: dict):
@@ -135,11 +168,45 @@ def print_response(response: dict):
             print(f"  Error code: {response['error']}")
 
 
+# Команды CLI: имя -> (сообщение об ошибке, если аргумент обязателен, сборка тела команды)
+COMMANDS = {
+    "add_symbol": ("symbol required", lambda arg: {"command": "add_symbol", "symbol": arg}),
+    "remove_symbol": ("symbol required", lambda arg: {"command": "remove_symbol", "symbol": arg}),
+    # Весь список уходит одной командой
+    "add_symbols": ("symbols required (comma-separated)",
+                    lambda arg: {"command": "add_symbols", "symbols": arg.split(",")}),
+    "remove_symbols": ("symbols required (comma-separated)",
+                       lambda arg: {"command": "remove_symbols", "symbols": arg.split(",")}),
+    "set_symbols": ("symbols required (comma-separated)",
+                    lambda arg: {"command": "set_symbols", "symbols": arg.split(",")}),
+    "get_symbols": (None, lambda arg: {"command": "get_symbols"}),
+    "get_statistics": (None, lambda arg: {"command": "get_statistics"}),
+}
+
+
+async def run_command(client: ControlClient, command: str):
+    """Выполнить команду из аргументов командной строки"""
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}")
+        sys.exit(1)
+    
+    required_error, build = COMMANDS[command]
+    arg = sys.argv[2] if len(sys.argv) > 2 else None
+    if required_error and arg is None:
+        print(f"Error: {required_error}")
+        sys.exit(1)
+    
+    response = await client.send_command(build(arg))
+    print_response(response)
+
+
 async def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  control_client.py add_symbol <SYMBOL>")
         print("  control_client.py remove_symbol <SYMBOL>")
+        print("  control_client.py add_symbols <SYMBOL1,SYMBOL2,...>")
+        print("  control_client.py remove_symbols <SYMBOL1,SYMBOL2,...>")
         print("  control_client.py set_symbols <SYMBOL1,SYMBOL2,...>")
         print("  control_client.py get_symbols")
         print("  control_client.py get_statistics")
@@ -150,52 +217,11 @@ async def main():
         print("  control_client.py set_symbols 'BTC/USDT:USDT,SOL/USDT:USDT'")
         sys.exit(1)
     
-    client = ControlClient()
     command = sys.argv[1]
     
-    if command == "add_symbol":
-        if len(sys.argv) < 3:
-            print("Error: symbol required")
-            sys.exit(1)
-        response = await client.send_command({
-            "command": "add_symbol",
-            "symbol": sys.argv[2]
-        })
-        print_response(response)
-    
-    elif command == "remove_symbol":
-        if len(sys.argv) < 3:
-            print("Error: symbol required")
-            sys.exit(1)
-        response = await client.send_command({
-            "command": "remove_symbol",
-            "symbol": sys.argv[2]
-        })
-        print_response(response)
-    
-    elif command == "set_symbols":
-        if len(sys.argv) < 3:
-            print("Error: symbols required (comma-separated)")
-            sys.exit(1)
-        symbols = sys.argv[2].split(",")
-        response = await client.send_command({
-            "command": "set_symbols",
-            "symbols": symbols
-        })
-        print_response(response)
-    
-    elif command == "get_symbols":
-        response = await client.send_command({"command": "get_symbols"})
-        print_response(response)
-    
-    elif command == "get_statistics":
-        response = await client.send_command({"command": "get_statistics"})
-        print_response(response)
-    
-    else:
-        print(f"Unknown command: {command}")
-        sys.exit(1)
+    async with ControlClient() as client:
+        await run_command(client, command)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -5,9 +5,9 @@ from models.config import Config
 
 def load_config(config_path: str = "config.json") -> Config:
     """Загружает и валидирует конфигурацию из JSON файла"""
-    with open(config_path, 'r') as f:
-        config_dict = json.load(f)
-    return Config(**config_dict)
+    # pydantic разбирает и валидирует JSON за один проход, без промежуточного dict
+    with open(config_path, 'rb') as f:
+        return Config.model_validate_json(f.read())
 
 
 def load_api_keys(keys_file: str) -> Dict[str, Dict[str, str]]:
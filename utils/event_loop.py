@@ -0,0 +1,15 @@
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Запускает корутину в event loop: uvloop, если установлен, иначе asyncio"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -0,0 +1,22 @@
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: dict) -> bytes:
+    """Сериализовать тело сообщения в JSON (orjson, если установлен)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def loads(body: bytes) -> dict:
+    """Разобрать JSON тело сообщения (orjson, если установлен)"""
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError наследует json.JSONDecodeError
+        return orjson.loads(body)
+    return json.loads(body.decode())
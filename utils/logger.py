@@ -1,13 +1,21 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 
 def setup_logging(level: str, log_file: str) -> None:
     """Настраивает логирование согласно vision.md раздел 10"""
+    # Запись в файл и консоль идет в фоновом потоке, event loop только кладет запись в очередь.
+    # Запись форматируется в QueueHandler, обработчики слушателя пишут готовое сообщение
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.FileHandler(log_file), logging.StreamHandler())
+    listener.start()
+    # При выходе дописываем оставшиеся в очереди записи
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         level=getattr(logging, level),
         format='%(asctime)s [%(levelname)s] [%(name)s] %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
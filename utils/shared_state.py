@@ -1,29 +1,39 @@
 import asyncio
 import logging
-from typing import List, Set
+import sys
+from typing import Dict, List, Set, Tuple
 
 
 class SharedState:
     """Разделяемое состояние между задачами для управления символами"""
     
     def __init__(self, initial_symbols: List[str]):
-        self.symbols: Set[str] = set(initial_symbols)
+        # Символы интернируем: одна строка на символ во всех коллекторах и снимках
+        self.symbols: Set[str] = set(map(sys.intern, initial_symbols))
+        # Блокировка только для писателей; читатели берут готовый снимок
         self.lock = asyncio.Lock()
         self.logger = logging.getLogger("shared_state")
+        self._snapshot: Tuple[str, ...] = ()
+        self._publish()
+    
+    def _publish(self):
+        """Собрать новый неизменяемый снимок символов и подменить его одной ссылкой"""
+        self._snapshot = tuple(sorted(self.symbols))
     
     async def get_symbols(self) -> List[str]:
-        """Получить текущий список символов"""
-        async with self.lock:
-            return sorted(list(self.symbols))
+        """Получить текущий отсортированный список символов (без блокировки)"""
+        # Копия снимка без сортировки: вызывающий код может менять свой список
+        return list(self._snapshot)
     
     async def add_symbol(self, symbol: str) -> bool:
         """Добавить символ. Возвращает True если добавлен, False если уже существует"""
         async with self.lock:
             if symbol not in self.symbols:
-                self.symbols.add(symbol)
-                self.logger.info(f"Added symbol: {symbol}")
+                self.symbols.add(sys.intern(symbol))
+                self._publish()
+                self.logger.info("Added symbol: %s", symbol)
                 return True
-            self.logger.warning(f"Symbol already exists: {symbol}")
+            self.logger.warning("Symbol already exists: %s", symbol)
             return False
     
     async def remove_symbol(self, symbol: str) -> bool:
@@ -31,14 +41,45 @@ class SharedState:
         async with self.lock:
             if symbol in self.symbols:
                 self.symbols.remove(symbol)
-                self.logger.info(f"Removed symbol: {symbol}")
+                self._publish()
+                self.logger.info("Removed symbol: %s", symbol)
                 return True
-            self.logger.warning(f"Symbol not found: {symbol}")
+            self.logger.warning("Symbol not found: %s", symbol)
             return False
     
-    async def set_symbols(self, symbols: List[str]):
-        """Заменить весь список символов"""
+    async def add_symbols(self, symbols: List[str]) -> List[str]:
+        """Добавить несколько символов за один захват блокировки. Возвращает добавленные"""
+        async with self.lock:
+            # Интернируем до изменения множества: не-строка упадет раньше, чем состояние разойдется со снимком
+            candidates = [sys.intern(symbol) for symbol in dict.fromkeys(symbols)]
+            added = [symbol for symbol in candidates if symbol not in self.symbols]
+            if added:
+                self.symbols.update(added)
+                self._publish()
+            self.logger.info("Added symbols: %s (%d skipped)", added, len(symbols) - len(added))
+            return added
+    
+    async def remove_symbols(self, symbols: List[str]) -> List[str]:
+        """Удалить несколько символов за один захват блокировки. Возвращает удаленные"""
+        async with self.lock:
+            removed = [symbol for symbol in dict.fromkeys(symbols) if symbol in self.symbols]
+            if removed:
+                self.symbols.difference_update(removed)
+                self._publish()
+            self.logger.info("Removed symbols: %s (%d skipped)", removed, len(symbols) - len(removed))
+            return removed
+    
+    async def set_symbols(self, symbols: List[str]) -> Dict[str, List[str]]:
+        """Заменить весь список символов. Возвращает добавленные и удаленные символы"""
         async with self.lock:
-            old_symbols = self.symbols.copy()
-            self.symbols = set(symbols)
-            self.logger.info(f"Symbols updated: {len(old_symbols)} -> {len(self.symbols)}")
+            new_symbols = set(map(sys.intern, symbols))
+            # Тот же набор: снимок не пересобираем
+            if new_symbols == self.symbols:
+                self.logger.info("Symbols unchanged: %d", len(self.symbols))
+                return {"added": [], "removed": []}
+            added = sorted(new_symbols - self.symbols)
+            removed = sorted(self.symbols - new_symbols)
+            self.symbols = new_symbols
+            self._publish()
+            self.logger.info("Symbols updated: +%d -%d, total %d", len(added), len(removed), len(self.symbols))
+            return {"added": added, "removed": removed}
@@ -1,22 +1,23 @@
 import logging
+from collections import defaultdict
 from typing import Dict
 
 
 class Statistics:
     def __init__(self):
-        self.exchange_success: Dict[str, int] = {}
-        self.exchange_errors: Dict[str, int] = {}
+        self.exchange_success: Dict[str, int] = defaultdict(int)
+        self.exchange_errors: Dict[str, int] = defaultdict(int)
         self.rabbitmq_published: int = 0
         self.rabbitmq_failed: int = 0
         self.logger = logging.getLogger("statistics")
     
     def record_success(self, exchange: str):
         """Записывает успешный сбор данных"""
-        self.exchange_success[exchange] = self.exchange_success.get(exchange, 0) + 1
+        self.exchange_success[exchange] += 1
     
     def record_error(self, exchange: str):
         """Записывает ошибку сбора данных"""
-        self.exchange_errors[exchange] = self.exchange_errors.get(exchange, 0) + 1
+        self.exchange_errors[exchange] += 1
     
     def record_published(self):
         """Записывает успешную публикацию в RabbitMQ"""
@@ -26,23 +27,32 @@ class Statistics:
         """Записывает неудачную публикацию в RabbitMQ"""
         self.rabbitmq_failed += 1
     
+    def record_publish_result(self, success: bool):
+        """Записывает результат публикации в RabbitMQ"""
+        if success:
+            self.record_published()
+        else:
+            self.record_publish_failed()
+    
     def print_and_reset(self):
         """Выводит статистику и сбрасывает счетчики"""
-        self.logger.info("=== Statistics (last 60s) ===")
-        
-        # Собираем все биржи
-        all_exchanges = sorted(set(list(self.exchange_success.keys()) + list(self.exchange_errors.keys())))
-        
-        if all_exchanges:
-            for exchange in all_exchanges:
-                success = self.exchange_success.get(exchange, 0)
-                errors = self.exchange_errors.get(exchange, 0)
-                self.logger.info(f"{exchange.capitalize()}: {success} success, {errors} errors")
-        else:
-            self.logger.info("No data collected yet")
-        
-        self.logger.info(f"RabbitMQ: {self.rabbitmq_published} published, {self.rabbitmq_failed} failed")
-        self.logger.info("=============================")
+        # Без уровня INFO не собираем строки отчета, только сбрасываем счетчики
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("=== Statistics (last 60s) ===")
+            
+            # Собираем все биржи
+            all_exchanges = sorted(self.exchange_success.keys() | self.exchange_errors.keys())
+            
+            if all_exchanges:
+                for exchange in all_exchanges:
+                    success = self.exchange_success.get(exchange, 0)
+                    errors = self.exchange_errors.get(exchange, 0)
+                    self.logger.info("%s: %d success, %d errors", exchange.capitalize(), success, errors)
+            else:
+                self.logger.info("No data collected yet")
+            
+            self.logger.info("RabbitMQ: %d published, %d failed", self.rabbitmq_published, self.rabbitmq_failed)
+            self.logger.info("=============================")
         
         # Сбрасываем счетчики
         self.exchange_success.clear()